@@ -0,0 +1,43 @@
+# SEED-CBC 구현별 속도 비교 스크립트
+#
+#   python benchmarks/seed_backends.py --blocks 1 --number 2000
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from hcspy import crypto  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SEED-CBC 구현별 속도를 비교합니다.")
+    parser.add_argument(
+        "--blocks", type=int, default=1, help="암호화할 블록(16바이트) 수"
+    )
+    parser.add_argument("--number", type=int, default=2000, help="반복 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 횟수")
+    args = parser.parse_args()
+
+    key, iv, data = os.urandom(16), os.urandom(16), os.urandom(16 * args.blocks)
+    print(f"{args.blocks} 블록 x {args.number}회, 최소 {args.repeat}회 측정")
+    for name, backend in crypto.SEED_BACKENDS.items():
+        cipher = backend(key)
+        best = min(
+            timeit.repeat(
+                lambda: cipher.cbc_encrypt(iv, data),
+                number=args.number,
+                repeat=args.repeat,
+            )
+        )
+        setup = min(timeit.repeat(lambda: backend(key), number=args.number, repeat=3))
+        print(
+            f"{name:>12}: 암호화 {best / args.number * 1e6:8.2f}us, "
+            f"키 준비 {setup / args.number * 1e6:8.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
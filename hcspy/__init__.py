@@ -1,5 +1,21 @@
+from .bulk import Account, LoginResult, SurveyResult
+from .executor import CryptoExecutor
 from .hcs import HCSClient
 from .http import HTTPClient, HTTPRequest
+from .transport import TransportManager
+from .version import ClientVersionResolver
+from .refresh import TokenRefresher
+from .search import OrganizationCache
+from .index import OrganizationIndex
+from .cache import NoticeContentCache
+from .store import (
+    MemoryTokenStore,
+    SQLiteTokenStore,
+    TokenEntry,
+    MemoryWatermarkStore,
+    SQLiteWatermarkStore,
+    NoticeWatermark,
+)
 from .model import (
     Organization,
     SurveyForm,
@@ -15,6 +31,22 @@ __all__ = (
     "HCSClient",
     "HTTPClient",
     "HTTPRequest",
+    "TransportManager",
+    "ClientVersionResolver",
+    "CryptoExecutor",
+    "Account",
+    "LoginResult",
+    "SurveyResult",
+    "MemoryTokenStore",
+    "SQLiteTokenStore",
+    "TokenEntry",
+    "MemoryWatermarkStore",
+    "SQLiteWatermarkStore",
+    "NoticeWatermark",
+    "TokenRefresher",
+    "OrganizationCache",
+    "OrganizationIndex",
+    "NoticeContentCache",
     "Organization",
     "SurveyForm",
     "Board",
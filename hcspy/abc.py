@@ -1,7 +1,10 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional, TYPE_CHECKING
 from json import dumps
 
+if TYPE_CHECKING:
+    from .store import NoticeWatermark, TokenEntry
+
 
 class HCSModelABC(metaclass=ABCMeta):
     @abstractmethod
@@ -24,3 +27,27 @@ class HCSModelABC(metaclass=ABCMeta):
         if self.response_data.get("isError"):
             return True
         return False
+
+
+class TokenStoreABC(metaclass=ABCMeta):
+    @abstractmethod
+    async def get(self, key: str) -> Optional["TokenEntry"]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, entry: "TokenEntry") -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class WatermarkStoreABC(metaclass=ABCMeta):
+    @abstractmethod
+    async def get(self, key: str) -> Optional["NoticeWatermark"]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, watermark: "NoticeWatermark") -> None:
+        raise NotImplementedError
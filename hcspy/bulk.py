@@ -0,0 +1,190 @@
+import asyncio
+from collections import Counter, OrderedDict, deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from .model import Organization
+from .user import User
+
+T = TypeVar("T")
+
+
+class Account(NamedTuple):
+    """로그인에 필요한 계정 정보입니다."""
+
+    organization: Organization
+    name: str
+    birthday: str
+    password: str
+
+
+AccountLike = Union[Account, Sequence[Any], Mapping[str, Any]]
+
+
+def to_account(account: AccountLike) -> Account:
+    """tuple이나 dict로 입력한 계정 정보를 <Account>로 변환합니다."""
+    if isinstance(account, Account):
+        return account
+    if isinstance(account, Mapping):
+        return Account(**account)
+    return Account(*account)
+
+
+class LoginResult:
+    """login_many에서 계정 하나의 로그인 결과를 담는 인스턴스입니다."""
+
+    __slots__ = ("account", "users", "error")
+
+    def __init__(
+        self,
+        account: Account,
+        users: Optional[List[User]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.account = account
+        self.users = users
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"<LoginResult name={self.account.name} ok={self.ok} error={self.error!r}>"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """로그인 성공 여부를 반환합니다."""
+        return self.error is None
+
+
+class HostScheduler(Generic[T]):
+    """
+    작업을 호스트(Organization.endpoint)별로 묶고, 호스트마다 동시에 실행되는 작업 수를 제한합니다.
+    여유가 있는 호스트의 작업을 번갈아가며 꺼내므로 한 호스트가 막혀도 다른 호스트의 작업은 계속 진행됩니다.
+    """
+
+    def __init__(self, items: Iterable[T], key: Any, per_host_limit: int = 0) -> None:
+        self.per_host_limit = per_host_limit
+        self._key = key
+        self._pending: "OrderedDict[Any, Deque[T]]" = OrderedDict()
+        self._active: "Counter[Any]" = Counter()
+        self._condition = asyncio.Condition()
+        for item in items:
+            self._pending.setdefault(key(item), deque()).append(item)
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._pending.values())
+
+    def _has_capacity(self, host: Any) -> bool:
+        return not self.per_host_limit or self._active[host] < self.per_host_limit
+
+    async def acquire(self) -> Optional[T]:
+        """실행할 다음 작업을 꺼냅니다. 남은 작업이 없으면 None을 반환합니다."""
+        async with self._condition:
+            while self._pending:
+                host = next(
+                    (host for host in self._pending if self._has_capacity(host)), None
+                )
+                if host is None:
+                    await self._condition.wait()
+                    continue
+                queue = self._pending.pop(host)
+                item = queue.popleft()
+                if queue:
+                    self._pending[host] = queue
+                self._active[host] += 1
+                return item
+            return None
+
+    async def release(self, item: T) -> None:
+        """끝난 작업의 호스트 자리를 반환합니다."""
+        async with self._condition:
+            self._active[self._key(item)] -= 1
+            self._condition.notify_all()
+
+
+class SurveyResult:
+    """check_many에서 유저 한명의 자가진단 결과를 담는 인스턴스입니다."""
+
+    __slots__ = ("target", "user", "error", "completed", "total")
+
+    def __init__(
+        self,
+        target: Union[User, Account],
+        user: Optional[User] = None,
+        error: Optional[BaseException] = None,
+        completed: int = 0,
+        total: int = 0,
+    ) -> None:
+        self.target = target
+        self.user = user
+        self.error = error
+        self.completed = completed
+        self.total = total
+
+    def __repr__(self) -> str:
+        return (
+            f"<SurveyResult user={self.user} ok={self.ok} "
+            f"progress={self.completed}/{self.total}>"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """자가진단 성공 여부를 반환합니다."""
+        return self.error is None
+
+
+async def run_scheduled(
+    scheduler: HostScheduler[T],
+    handler: Callable[[T], Awaitable[List[Any]]],
+    concurrency: int,
+) -> AsyncIterator[Any]:
+    """
+    scheduler의 작업들을 최대 concurrency개씩 handler로 실행하고, 결과를 끝나는 순서대로 반환합니다.
+    handler는 예외를 발생시키지 않고 결과 목록을 반환해야 합니다.
+    """
+    results: "asyncio.Queue[Optional[List[Any]]]" = asyncio.Queue()
+
+    async def worker() -> None:
+        while True:
+            item = await scheduler.acquire()
+            if item is None:
+                return
+            try:
+                results.put_nowait(await handler(item))
+            finally:
+                await scheduler.release(item)
+
+    async def run_workers() -> None:
+        try:
+            await asyncio.gather(
+                *(worker() for _ in range(max(1, min(concurrency, len(scheduler)))))
+            )
+        finally:
+            results.put_nowait(None)
+
+    runner = asyncio.ensure_future(run_workers())
+    try:
+        while True:
+            batch = await results.get()
+            if batch is None:
+                break
+            for result in batch:
+                yield result
+        await runner
+    finally:
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
@@ -0,0 +1,154 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+NoticeKey = Tuple[str, str]
+
+_MISSING = object()
+
+
+class NoticeContentCache:
+    """
+    공지사항 내용(/v2/selectNotice)을 (endpoint, idxNtc) 별로 캐시합니다.
+    같은 호스트의 공지사항 내용은 유저와 상관없이 같으므로 Client의 모든 유저가 함께 사용합니다.
+
+    메모리에는 최근에 사용한 maxsize개만 보관하며(LRU), path를 입력하면 SQLite 파일에도 저장합니다.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: float = 3600.0, path: Optional[str] = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        maxsize: int
+            메모리에 보관할 최대 공지사항 수를 입력합니다. 기본값은 1024 입니다.
+        ttl: float
+            공지사항 내용을 캐시할 시간(초)을 입력합니다. 기본값은 3600 입니다.
+        path: Optional[str]
+            공지사항 내용을 함께 저장할 SQLite 데이터베이스 파일 경로를 입력합니다.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._entries: "OrderedDict[NoticeKey, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[NoticeKey, "asyncio.Future[Any]"] = {}
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS notice_contents ("
+                    "endpoint TEXT NOT NULL, code TEXT NOT NULL, content TEXT, "
+                    "stored_at REAL NOT NULL, PRIMARY KEY (endpoint, code))"
+                )
+
+    def __repr__(self) -> str:
+        return f"<NoticeContentCache size={len(self._entries)} maxsize={self.maxsize} path={self.path}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_memory(self, key: NoticeKey) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        stored_at, content = entry
+        if time.time() - stored_at >= self.ttl:
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return content
+
+    def _set_memory(self, key: NoticeKey, content: Any, stored_at: float) -> None:
+        self._entries[key] = (stored_at, content)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _execute(self, query: str, *params: object) -> List[Any]:
+        with self._lock:
+            # close()와 동시에 실행될 수 있으므로 잠금을 잡은 뒤 연결을 확인합니다.
+            # close() 이후에 끝난 요청은 파일에 저장하지 않습니다.
+            connection = self._connection
+            if connection is None:
+                return []
+            with connection:
+                return connection.execute(query, params).fetchall()
+
+    async def _get_disk(self, key: NoticeKey) -> Any:
+        rows = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._execute,
+            "SELECT content, stored_at FROM notice_contents "
+            "WHERE endpoint = ? AND code = ? AND stored_at > ?",
+            *key,
+            time.time() - self.ttl,
+        )
+        if not rows:
+            return _MISSING
+        content, stored_at = rows[0]
+        self._set_memory(key, content, stored_at)
+        return content
+
+    async def get_or_load(
+        self, endpoint: str, code: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        캐시된 공지사항 내용을 반환합니다. 캐시에 없으면 loader로 가져와 저장하며,
+        같은 공지사항을 동시에 요청하면 loader는 한번만 실행됩니다.
+
+        Parameters
+        ----------
+        endpoint: str
+            학교 api 주소를 입력합니다.
+        code: str
+            공지사항의 글 id를 입력합니다.
+        loader: Callable[[], Awaitable[Any]]
+            캐시에 없을 때 공지사항 내용을 가져올 함수를 입력합니다.
+        """
+        key = (endpoint, str(code))
+        content = self._get_memory(key)
+        if content is not _MISSING:
+            return content
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._load(key, loader))
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, key: NoticeKey, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if self._connection is not None:
+            content = await self._get_disk(key)
+            if content is not _MISSING:
+                return content
+        content = await loader()
+        stored_at = time.time()
+        self._set_memory(key, content, stored_at)
+        if self._connection is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._execute,
+                "INSERT OR REPLACE INTO notice_contents VALUES (?, ?, ?, ?)",
+                *key,
+                content,
+                stored_at,
+            )
+        return content
+
+    def clear(self) -> None:
+        """메모리와 파일에 저장된 공지사항 내용을 모두 지웁니다."""
+        self._entries.clear()
+        if self._connection is not None:
+            self._execute("DELETE FROM notice_contents")
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -9,13 +9,104 @@ from Crypto.PublicKey import RSA
 
 from . import seed
 
+try:
+    from cryptography.hazmat.decrepit.ciphers.algorithms import SEED as _NativeSEED
+except ImportError:
+    try:
+        from cryptography.hazmat.primitives.ciphers.algorithms import (
+            SEED as _NativeSEED,
+        )
+    except ImportError:
+        _NativeSEED = None
+
+if _NativeSEED is not None:
+    from cryptography.hazmat.primitives.ciphers import Cipher, modes
+
+
+class PythonSeedBackend:
+    """hcspy.seed 를 사용하는 SEED-CBC 구현입니다."""
+
+    name = "python"
+
+    def __init__(self, key: bytes) -> None:
+        self._seed = seed.SEED()
+        self._round_key = self._seed.SeedRoundKey(key)
+
+    def cbc_encrypt(self, iv: bytes, data: bytes) -> bytes:
+        return self._seed.my_cbc_encrypt(data, self._round_key, iv)
+
+
+class CryptographySeedBackend:
+    """cryptography 패키지(OpenSSL)의 SEED 구현을 사용하는 SEED-CBC 구현입니다."""
+
+    name = "cryptography"
+
+    def __init__(self, key: bytes) -> None:
+        self._algorithm = _NativeSEED(bytes(key))
+
+    def cbc_encrypt(self, iv: bytes, data: bytes) -> bytes:
+        encryptor = Cipher(self._algorithm, modes.CBC(bytes(iv))).encryptor()
+        return encryptor.update(bytes(data)) + encryptor.finalize()
+
+
+def _native_backend_available() -> bool:
+    if _NativeSEED is None:
+        return False
+    # OpenSSL 빌드에 따라 SEED가 비활성화되어 있을 수 있어 RFC 4269 벡터로 확인합니다.
+    try:
+        encrypted = CryptographySeedBackend(bytes(16)).cbc_encrypt(
+            bytes(16), bytes(range(16))
+        )
+    except Exception:
+        return False
+    return encrypted == bytes.fromhex("5ebac6e0054e166819aff1cc6d346cdb")
+
+
+SEED_BACKENDS = {PythonSeedBackend.name: PythonSeedBackend}
+if _native_backend_available():
+    SEED_BACKENDS[CryptographySeedBackend.name] = CryptographySeedBackend
+
+DEFAULT_SEED_BACKEND = (
+    CryptographySeedBackend.name
+    if CryptographySeedBackend.name in SEED_BACKENDS
+    else PythonSeedBackend.name
+)
+
+
+def get_seed_backend(name=None):
+    """
+    SEED-CBC 구현 클래스를 반환합니다.
+    name을 비워두면 사용할 수 있는 가장 빠른 구현을 반환합니다.
+    """
+    name = name or DEFAULT_SEED_BACKEND
+    if name not in SEED_BACKENDS:
+        raise ValueError(
+            f"{name} SEED 구현을 사용할 수 없습니다. (사용 가능: {', '.join(SEED_BACKENDS)})"
+        )
+    return SEED_BACKENDS[name]
+
 
 class Crypto:
-    def __init__(self) -> None:
+    def __init__(self, seed_backend=None) -> None:
         self.uuid = os.urandom(int(32)).hex()
         self.genSessionKey = os.urandom(int(8)).hex()
         self.key = None
         self.sessionKey = [int(i, 16) for i in list(self.genSessionKey)]
+        self.seed_backend = get_seed_backend(seed_backend)
+        self._cipher = None
+
+    def __getstate__(self):
+        # 프로세스 풀로 보낼 수 있도록 RsaKey는 DER로, SEED 구현은 다시 만들도록 저장합니다.
+        state = self.__dict__.copy()
+        state["_cipher"] = None
+        if self.key is not None:
+            state["key"] = self.key.export_key("DER")
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state.get("key"), bytes):
+            state["key"] = RSA.import_key(state["key"])
+        self.__dict__.update(state)
 
     def _pad(self, txt):
         if len(txt) < 16:
@@ -34,10 +125,18 @@ class Crypto:
             msg=msg, key=self.genSessionKey.encode(), digestmod=hashlib.sha256
         ).hexdigest()
 
+    @property
+    def cipher(self):
+        if self._cipher is None:
+            self._cipher = self.seed_backend(bytes(self.sessionKey))
+        return self._cipher
+
     def seed_encrypt(self, iv, data):
-        s = seed.SEED()
-        round_key = s.SeedRoundKey(bytes(self.sessionKey))
-        return s.my_cbc_encrypt(self._pad(data), round_key, iv)
+        return self.cipher.cbc_encrypt(iv, self._pad(data))
+
+    def seed_encrypt_many(self, iv, messages):
+        cipher = self.cipher
+        return [cipher.cbc_encrypt(iv, self._pad(data)) for data in messages]
 
     def set_pub_key(self, b64):
         data = b64decode(b64)
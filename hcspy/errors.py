@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 
 class HCSException(Exception):
@@ -35,3 +35,13 @@ class PasswordLengthError(HCSException):
 
 class AlreadyAgreed(HCSException):
     pass
+
+
+class PartialFailure(HCSException):
+    def __init__(
+        self, message: str, results: List[Any], errors: Dict[int, BaseException]
+    ) -> None:
+        self.results = results
+        self.errors = errors
+
+        super().__init__(message)
@@ -0,0 +1,92 @@
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+ExecutorMode = Literal["inline", "thread", "process"]
+
+
+class CryptoExecutor:
+    """RSA, SEED 같은 CPU 작업을 실행할 위치를 관리합니다.
+
+    - inline: 이벤트 루프에서 바로 실행합니다. (기본값)
+    - thread: 스레드 풀에서 실행합니다.
+    - process: 프로세스 풀에서 실행합니다. 실행할 함수와 인자는 pickle 할 수 있어야 합니다.
+    """
+
+    __slots__ = ("mode", "max_workers", "_executor", "_owns_executor")
+
+    def __init__(
+        self,
+        mode: ExecutorMode = "inline",
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        mode: Literal["inline", "thread", "process"]
+            암호화 작업을 실행할 방식을 선택합니다. 기본값은 inline 입니다.
+        max_workers: Optional[int]
+            스레드 풀이나 프로세스 풀의 최대 작업자 수를 입력합니다.
+        executor: Optional[concurrent.futures.Executor]
+            기존 Executor를 사용합니다. 이 경우 mode와 max_workers는 무시되며 종료하지 않습니다.
+        """
+        if executor is not None:
+            mode = "process" if isinstance(executor, ProcessPoolExecutor) else "thread"
+        elif mode not in ("inline", "thread", "process"):
+            raise ValueError(f"{mode} 실행 방식은 지원하지 않습니다.")
+        self.mode = mode
+        self.max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __repr__(self) -> str:
+        return f"<CryptoExecutor mode={self.mode} max_workers={self.max_workers}>"
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """작업을 실행할 Executor를 반환합니다. inline 방식인 경우 None을 반환합니다."""
+        if self._executor is None and self.mode != "inline":
+            if self.mode == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hcspy-crypto"
+                )
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """함수를 설정된 방식으로 실행하고 결과를 반환합니다.
+
+        Parameters
+        ----------
+        func: Callable
+            실행할 함수를 입력합니다.
+        args: Any
+            함수에 전달할 인자를 입력합니다.
+        """
+        executor = self.executor
+        if executor is None:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """직접 생성한 스레드 풀이나 프로세스 풀을 종료합니다."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+def create_crypto_executor(
+    value: Union[ExecutorMode, CryptoExecutor, Executor, None],
+) -> CryptoExecutor:
+    """문자열, Executor, CryptoExecutor 를 CryptoExecutor로 변환합니다."""
+    if isinstance(value, CryptoExecutor):
+        return value
+    if isinstance(value, Executor):
+        return CryptoExecutor(executor=value)
+    return CryptoExecutor(mode=value or "inline")
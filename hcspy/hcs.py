@@ -1,34 +1,176 @@
-from typing import List, Optional, Any, Literal
+import asyncio
+import contextlib
+import time
+from concurrent.futures import Executor
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Any,
+    Literal,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 
-from .errors import AuthorizeError
+from .bulk import (
+    Account,
+    AccountLike,
+    HostScheduler,
+    LoginResult,
+    SurveyResult,
+    run_scheduled,
+    to_account,
+)
+from .abc import TokenStoreABC
+from .errors import AccessTokenExpired, AuthorizeError, HTTPException, PartialFailure
+from .executor import CryptoExecutor, ExecutorMode
 from .http import HTTPClient, Route
 from .model import Organization
+from .refresh import TokenRefresher
+from .search import OrganizationCache, SearchQuery
+from .store import TokenEntry, account_key, password_digest, verify_password
+from .transport import TransportManager
 from .user import User
-from .utils import duplicate, duplicated
+from .utils import (
+    duplicate,
+    duplicated,
+    gather_limited,
+    is_token_expired,
+    run_stages,
+)
 
 
 @duplicated
 class HCSClient:
     """ "https://hcs.eduro.go.kr api 레퍼 Client 입니다."""
 
-    __slots__ = "_http_client"
+    __slots__ = (
+        "_http_client",
+        "_transport",
+        "_token_store",
+        "_token_refresher",
+        "_organization_cache",
+        "_version_refresh_interval",
+    )
 
     def __init__(
         self,
         session: Optional[aiohttp.ClientSession] = None,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[float] = None,
+        version_ttl: float = 3600.0,
+        version_refresh_interval: Optional[float] = None,
+        transkey_cache_ttl: Optional[float] = 600.0,
+        keypad_pool_size: int = 0,
+        keypad_pool_max_age: float = 60.0,
+        crypto_executor: Union[ExecutorMode, CryptoExecutor, Executor, None] = None,
+        token_store: Optional[TokenStoreABC] = None,
+        token_refresher: Optional[TokenRefresher] = None,
+        organization_cache_ttl: Optional[float] = 600.0,
+        access_key_ttl: Optional[float] = None,
+        notice_cache_size: int = 1024,
+        notice_cache_ttl: Optional[float] = 3600.0,
+        notice_cache_path: Optional[str] = None,
     ):
         """Client를 http client와 함께 생성합니다
 
+        세션은 처음 요청할 때 생성되며, 이 Client로 로그인한 모든 유저가 같은 커넥션 풀을 공유합니다.
+
         Parameters
         ----------
         session: Optional[aiohttp.ClientSession]
             세 세션을 생성하지 않고 기존 세션을 사용합니다.
+        limit: int
+            전체 커넥션 풀의 최대 크기를 입력합니다. 0일 경우 제한하지 않습니다. 기본값은 100 입니다.
+        limit_per_host: int
+            호스트(atptOfcdcConctUrl)별 최대 커넥션 수를 입력합니다. 0일 경우 제한하지 않습니다.
+        keepalive_timeout: float
+            사용하지 않는 커넥션을 유지할 시간(초)을 입력합니다. 기본값은 30 입니다.
+        ttl_dns_cache: Optional[int]
+            DNS 조회 결과를 캐시할 시간(초)을 입력합니다. None일 경우 만료되지 않습니다.
+        timeout: Optional[float]
+            요청 전체 타임아웃(초)을 입력합니다. 비워둘 경우 aiohttp 기본값을 사용합니다.
+        version_ttl: float
+            자가진단 클라이언트 버전을 캐시할 시간(초)을 입력합니다. 기본값은 3600 입니다.
+        version_refresh_interval: Optional[float]
+            입력한 경우 이 주기(초)마다 백그라운드에서 클라이언트 버전을 갱신합니다.
+            갱신은 warm_up 이나 처음 로그인할 때 시작되며, 비워둘 경우 만료된 뒤 사용할 때 가져옵니다.
+        transkey_cache_ttl: Optional[float]
+            보안 키보드 공개키와 키 좌표를 캐시할 시간(초)을 입력합니다. None일 경우 캐시하지 않습니다.
+        keypad_pool_size: int
+            미리 준비해둘 보안 키패드 수를 입력합니다. 0일 경우 로그인할 때마다 새로 만듭니다.
+        keypad_pool_max_age: float
+            미리 준비한 보안 키패드를 사용할 수 있는 시간(초)을 입력합니다. 기본값은 60 입니다.
+        crypto_executor: Union[str, CryptoExecutor, concurrent.futures.Executor, None]
+            RSA, SEED 암호화를 실행할 방식(inline, thread, process)이나 Executor를 입력합니다.
+            비워둘 경우 이벤트 루프에서 바로 실행합니다.
+        token_store: Optional[TokenStoreABC]
+            로그인 토큰을 저장할 저장소(MemoryTokenStore, SQLiteTokenStore 등)를 입력합니다.
+            입력한 경우 login은 저장된 토큰이 만료되었을 때만 다시 로그인합니다.
+        token_refresher: Optional[TokenRefresher]
+            입력한 경우 로그인한 유저들의 토큰을 만료되기 전에 백그라운드에서 갱신합니다.
+        organization_cache_ttl: Optional[float]
+            기관 검색 결과를 캐시할 시간(초)을 입력합니다. None일 경우 캐시하지 않습니다.
+        access_key_ttl: Optional[float]
+            기관 검색 키를 사용할 시간(초)을 입력합니다. 비워둘 경우 검색 키가 만료되었을 때만 다시 검색합니다.
+        notice_cache_size: int
+            메모리에 캐시할 최대 공지사항 내용 수를 입력합니다. 기본값은 1024 입니다.
+        notice_cache_ttl: Optional[float]
+            공지사항 내용을 캐시할 시간(초)을 입력합니다. None일 경우 캐시하지 않습니다.
+        notice_cache_path: Optional[str]
+            공지사항 내용을 함께 저장할 SQLite 데이터베이스 파일 경로를 입력합니다.
         """
-        if not session:
-            session = aiohttp.ClientSession()
-        self._http_client = HTTPClient(session=session)
+        self._token_store = token_store
+        self._token_refresher = token_refresher
+        self._version_refresh_interval = version_refresh_interval
+        self._transport = TransportManager(
+            session=session,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            timeout=timeout,
+        )
+        self._http_client = HTTPClient(
+            transport=self._transport,
+            version_ttl=version_ttl,
+            transkey_cache_ttl=transkey_cache_ttl,
+            keypad_pool_size=keypad_pool_size,
+            keypad_pool_max_age=keypad_pool_max_age,
+            crypto_executor=crypto_executor,
+            notice_cache_size=notice_cache_size,
+            notice_cache_ttl=notice_cache_ttl,
+            notice_cache_path=notice_cache_path,
+        )
+        self._organization_cache = OrganizationCache(
+            self._search_organization,
+            ttl=organization_cache_ttl,
+            key_ttl=access_key_ttl,
+        )
+
+    @property
+    def transport(self) -> TransportManager:
+        return self._transport
+
+    @property
+    def token_store(self) -> Optional[TokenStoreABC]:
+        return self._token_store
+
+    @property
+    def token_refresher(self) -> Optional[TokenRefresher]:
+        return self._token_refresher
+
+    @property
+    def organization_cache(self) -> OrganizationCache:
+        return self._organization_cache
 
     @property
     def endpoint(self) -> str:
@@ -41,8 +183,29 @@ class HCSClient:
         await self.close()
 
     async def close(self):
+        if self._token_refresher is not None:
+            await self._token_refresher.close()
         await self._http_client.close()
 
+    async def warm_up(self) -> None:
+        """
+        로그인 전에 자가진단 클라이언트 버전을 가져오고 보안 키패드 풀을 채웁니다.
+        version_refresh_interval 을 입력한 경우 클라이언트 버전 갱신도 시작합니다.
+        """
+        self._start_version_refresh()
+        keypad_pool = self._http_client.keypad_pool
+        if keypad_pool is not None:
+            await asyncio.gather(
+                self._http_client.version_resolver.get(), keypad_pool.fill()
+            )
+            keypad_pool.start()
+        else:
+            await self._http_client.version_resolver.get()
+
+    def _start_version_refresh(self) -> None:
+        if self._version_refresh_interval:
+            self._http_client.version_resolver.start(self._version_refresh_interval)
+
     @duplicate("search_school", "search_university", "search_office")
     async def search_organization(
         self,
@@ -63,20 +226,22 @@ class HCSClient:
             학교(기관) 유형을 선택합니다. 이 옵션은 기관이 학교인 경우만 사용할 수 있습니다.
         area: Optional[str]
             학교(기관) 지역을 선택합니다. 이 옵션은 기관이 학교인 경우만 사용할 수 있습니다.
+
+        같은 검색 결과는 Client의 organization_cache_ttl 동안 캐시되며 같은 <Organization> 객체를 반환합니다.
         """
-        kwargs = {"name": name, "search_type": search_type}
+        if search_type != "school":
+            level, area = None, None
+        return await self._organization_cache.search((search_type, name, level, area))
+
+    async def _search_organization(self, query: SearchQuery) -> Tuple[Any, str]:
+        search_type, name, level, area = query
+        kwargs: Dict[str, Any] = {"name": name, "search_type": search_type}
         if search_type == "school":
             kwargs["level"] = level
             kwargs["area"] = area
+        access_key: str
         response, access_key = await self._http_client.search_organization(**kwargs)
-        return [
-            Organization(
-                organization_type=search_type,
-                access_key=access_key,
-                **organization_data,
-            )
-            for organization_data in response
-        ]
+        return response, access_key
 
     async def find_user(
         self,
@@ -95,8 +260,25 @@ class HCSClient:
             사용자 이름을 입력합니다.
         birthday: str
             본인의 생년월일 8자리를 입력합니다.
+
+        기관 검색 키가 없거나 access_key_ttl보다 오래되었거나 만료된 경우 기관을 다시 검색해 검색 키를 갱신한 뒤 시도합니다.
         """
-        response = await self._http_client.find_user(
+        search_key = organization.key
+        if self._organization_cache.is_key_stale(
+            organization
+        ) and await self._organization_cache.refresh_key(organization, search_key):
+            search_key = organization.key
+        try:
+            return await self._find_user(organization, name, birthday)
+        except AccessTokenExpired:
+            if not await self._organization_cache.refresh_key(organization, search_key):
+                raise
+        return await self._find_user(organization, name, birthday)
+
+    async def _find_user(
+        self, organization: Organization, name: str, birthday: str
+    ) -> Any:
+        return await self._http_client.find_user(
             endpoint=organization.endpoint,
             code=organization.id,
             name=name,
@@ -104,7 +286,6 @@ class HCSClient:
             organization_type=organization.type,
             search_key=organization.key,
         )
-        return response
 
     @duplicate("login_with_token")
     async def token_login(
@@ -122,10 +303,29 @@ class HCSClient:
         password: str
             사용자 비밀번호 4자리를 입력합니다.
         """
+        _, group = await self._validate_password(
+            organization=organization, token=token, password=password
+        )
+        return self._track(
+            [
+                User(state=self._http_client, organization=organization, **user_data)
+                for user_data in group
+            ]
+        )
+
+    async def _validate_password(
+        self,
+        organization: Organization,
+        token: str,
+        password: str,
+        prepared: Optional[Any] = None,
+    ) -> Tuple[str, Any]:
+        """비밀번호를 확인하고 (그룹 토큰, 그룹에 속한 유저 목록)을 반환합니다."""
         user_token = await self._http_client.use_security_keypad(
             endpoint=organization.endpoint,
             token=token,
             password=password,
+            prepared=prepared,
         )
         if user_token.get("isError") is True and user_token.get("errorCode") == 1001:
             failed_count = user_token["data"].get("failCnt")
@@ -133,10 +333,7 @@ class HCSClient:
         group = await self._http_client.get_group(
             endpoint=organization.endpoint, token=user_token["token"]
         )
-        return [
-            User(state=self._http_client, organization=organization, **user_data)
-            for user_data in group
-        ]
+        return user_token["token"], group
 
     @duplicate("get_group")
     async def login(
@@ -145,6 +342,7 @@ class HCSClient:
         name: str,
         birthday: str,
         password: str,
+        concurrency: int = 4,
     ) -> List[User]:
         """자가진단 사이트에 로그인을 진행합니다.
 
@@ -158,42 +356,401 @@ class HCSClient:
             사용자 생년월일 6자리를 입력합니다.
         password: str
             사용자 비밀번호 4자리를 입력합니다.
+        concurrency: int
+            그룹에 속한 유저 정보를 동시에 가져올 최대 요청 수를 입력합니다. 기본값은 4 입니다.
+
+        Client에 토큰 저장소가 설정되어 있으면 저장된 토큰이 만료되지 않은 경우 그 토큰으로 로그인합니다.
         """
-        user_data = await self.find_user(
-            organization=organization, name=name, birthday=birthday
+        group = await self._authenticate(organization, name, birthday, password)
+        return await self._get_group_users(organization, group, concurrency)
+
+    async def _authenticate(
+        self, organization: Organization, name: str, birthday: str, password: str
+    ) -> List[Any]:
+        """로그인을 진행하고 그룹에 속한 유저 목록(selectUserGroup)을 반환합니다."""
+        self._start_version_refresh()
+        if self._token_store is not None:
+            stored_group = await self._login_with_store(
+                organization, name, birthday, password
+            )
+            if stored_group is not None:
+                return stored_group
+        endpoint = organization.endpoint
+
+        async def find_user(_: Any) -> Any:
+            return await self.find_user(
+                organization=organization, name=name, birthday=birthday
+            )
+
+        async def update_agreement(results: Any) -> None:
+            user_data = results["findUser"]
+            if not user_data.get("pInfAgrmYn") == "N":
+                await self._http_client.update_agreement(
+                    endpoint=endpoint, token=user_data.get("token")
+                )
+
+        async def password_exist(results: Any) -> None:
+            if not await self._http_client.password_exist(
+                endpoint=endpoint,
+                token=results["findUser"].get("token"),
+            ):
+                raise AuthorizeError(
+                    "설정된 비밀번호가 없습니다. 자가진단 사이트에서 초기 비밀번호를 설정하세요."
+                )
+
+        async def validate_password(results: Any) -> Tuple[str, Any]:
+            return await self._validate_password(
+                organization=organization,
+                token=results["findUser"].get("token"),
+                password=password,
+                prepared=results["keypad"],
+            )
+
+        # 보안 키보드 핸드셰이크는 findUser 토큰이 필요 없으므로 처음부터 함께 진행합니다.
+        results = await run_stages(
+            {
+                "keypad": ((), lambda _: self._http_client.prepare_security_keypad()),
+                "findUser": ((), find_user),
+                "updateAgreement": (("findUser",), update_agreement),
+                "hasPassword": (("updateAgreement",), password_exist),
+                "validatePassword": (("hasPassword", "keypad"), validate_password),
+            }
         )
-        if not user_data.get("pInfAgrmYn") == "N":
-            await self._http_client.update_agreement(
-                endpoint=organization.endpoint, token=user_data.get("token")
+        group: List[Any]
+        group_token, group = results["validatePassword"]
+        if self._token_store is not None:
+            digest = await self._http_client.crypto_executor.run(
+                password_digest, password
+            )
+            await self._token_store.set(
+                account_key(organization, name, birthday),
+                TokenEntry(
+                    find_token=results["findUser"].get("token"),
+                    group_token=group_token,
+                    password_digest=digest,
+                ),
+            )
+        return group
+
+    async def _login_with_store(
+        self,
+        organization: Organization,
+        name: str,
+        birthday: str,
+        password: str,
+    ) -> Optional[List[Any]]:
+        """
+        토큰 저장소에 저장된 토큰으로 로그인합니다.
+        비밀번호가 저장된 해시와 같고 그룹 토큰이 유효하면 핸드셰이크 없이,
+        그 외에 findUser 토큰이 유효하면 비밀번호 확인만 다시 진행합니다.
+        저장된 토큰을 사용할 수 없는 경우 None을 반환합니다.
+        """
+        token_store = self._token_store
+        if token_store is None:
+            return None
+        key = account_key(organization, name, birthday)
+        entry = await token_store.get(key)
+        if entry is None:
+            return None
+        # 그룹 토큰은 비밀번호를 다시 확인하지 않으므로, 비밀번호가 같을 때만 사용합니다.
+        if (
+            entry.group_token is not None
+            and not is_token_expired(entry.group_token)
+            and await self._http_client.crypto_executor.run(
+                verify_password, password, entry.password_digest
             )
-        if not await self._http_client.password_exist(
-            endpoint=organization.endpoint,
-            token=user_data.get("token"),
         ):
-            raise AuthorizeError("설정된 비밀번호가 없습니다. 자가진단 사이트에서 초기 비밀번호를 설정하세요.")
-        user_token = await self._http_client.use_security_keypad(
-            endpoint=organization.endpoint,
-            token=user_data.get("token"),
-            password=password,
+            try:
+                group: List[Any] = await self._http_client.get_group(
+                    endpoint=organization.endpoint, token=entry.group_token
+                )
+            except HTTPException:
+                pass
+            else:
+                return group
+        if entry.find_token is not None and not is_token_expired(entry.find_token):
+            try:
+                group_token, group = await self._validate_password(
+                    organization=organization, token=entry.find_token, password=password
+                )
+            except HTTPException:
+                pass
+            else:
+                digest = await self._http_client.crypto_executor.run(
+                    password_digest, password
+                )
+                await token_store.set(
+                    key, entry._replace(group_token=group_token, password_digest=digest)
+                )
+                return group
+        await token_store.delete(key)
+        return None
+
+    async def login_many(
+        self,
+        accounts: Iterable[AccountLike],
+        concurrency: int = 50,
+        per_host_limit: int = 0,
+    ) -> AsyncIterator[LoginResult]:
+        """여러 계정을 동시에 로그인하고, 끝나는 순서대로 결과를 반환합니다.
+
+        모든 계정은 이 Client의 커넥션 풀을 함께 사용하며, 기관 호스트(Organization.endpoint)별로
+        묶어서 번갈아가며 로그인합니다. 실패한 계정은 예외 대신 error가 담긴 결과로 반환됩니다.
+
+        Parameters
+        ----------
+        accounts: Iterable[Union[Account, tuple, dict]]
+            (기관, 이름, 생년월일, 비밀번호) 로 이루어진 계정 정보들을 입력합니다.
+        concurrency: int
+            동시에 진행할 최대 로그인 수를 입력합니다. 기본값은 50 입니다.
+        per_host_limit: int
+            호스트별로 동시에 진행할 최대 로그인 수를 입력합니다. 0일 경우 제한하지 않습니다.
+        """
+        scheduler: HostScheduler[Account] = HostScheduler(
+            (to_account(account) for account in accounts),
+            key=lambda account: account.organization.endpoint,
+            per_host_limit=per_host_limit,
         )
-        if user_token.get("isError") is True and user_token.get("errorCode") == 1001:
-            failed_count = user_token["data"].get("failCnt")
-            raise AuthorizeError(f"비밀번호가 다릅니다 (시도 횟수: {failed_count}/5)")
-        group = await self._http_client.get_group(
-            endpoint=organization.endpoint, token=user_token["token"]
+
+        async def handle(account: Account) -> List[LoginResult]:
+            try:
+                users = await self.login(*account)
+            except Exception as error:
+                return [LoginResult(account, error=error)]
+            return [LoginResult(account, users=users)]
+
+        async for result in run_scheduled(scheduler, handle, concurrency):
+            yield result
+
+    async def check_many(
+        self,
+        targets: Iterable[Union[User, AccountLike]],
+        option1: bool = False,
+        option2: Union[bool, None] = None,
+        option3: bool = False,
+        concurrency: int = 50,
+        per_host_limit: int = 0,
+    ) -> AsyncIterator[SurveyResult]:
+        """여러 유저의 자가진단을 동시에 실행하고, 끝나는 순서대로 결과를 반환합니다.
+
+        계정 정보를 입력한 경우 로그인한 뒤 그룹에 속한 모든 유저의 자가진단을 실행합니다.
+        클라이언트 버전은 시작하기 전에 한번만 가져오며, 실패한 유저는 예외 대신 error가 담긴 결과로 반환됩니다.
+        각 결과의 completed, total 로 전체 진행 상황을 확인할 수 있습니다.
+
+        Parameters
+        ----------
+        targets: Iterable[Union[User, Account, tuple, dict]]
+            자가진단을 실행할 유저나 계정 정보들을 입력합니다.
+        option1:
+            옵션 1번입니다. <User>.check 를 참고하세요.
+        option2:
+            옵션 2번입니다. <User>.check 를 참고하세요.
+        option3:
+            옵션 3번입니다. <User>.check 를 참고하세요.
+        concurrency: int
+            동시에 진행할 최대 유저(계정) 수를 입력합니다. 기본값은 50 입니다.
+        per_host_limit: int
+            호스트별로 동시에 진행할 최대 유저(계정) 수를 입력합니다. 0일 경우 제한하지 않습니다.
+        """
+        scheduler: HostScheduler[Union[User, Account]] = HostScheduler(
+            (
+                target if isinstance(target, User) else to_account(target)
+                for target in targets
+            ),
+            key=lambda target: target.organization.endpoint,
+            per_host_limit=per_host_limit,
         )
-        return [
-            User(
-                state=self._http_client,
-                organization=organization,
-                **(
-                    await self._http_client.get_user(
-                        endpoint=organization.endpoint,
-                        code=organization.id,
-                        user_id=user_data["userPNo"],
-                        token=user_data["token"],
+        total = len(scheduler)
+        completed = 0
+        await self._prefetch_version()
+
+        async def handle(target: Union[User, Account]) -> List[SurveyResult]:
+            nonlocal completed
+            outcomes: List[Tuple[Optional[User], Optional[BaseException]]]
+            if isinstance(target, User):
+                try:
+                    await target.check(
+                        option1=option1, option2=option2, option3=option3
                     )
-                ),
+                except Exception as error:
+                    outcomes = [(target, error)]
+                else:
+                    outcomes = [(target, None)]
+            else:
+                try:
+                    group = await self._authenticate(*target)
+                except Exception as error:
+                    outcomes = [(None, error)]
+                else:
+                    outcomes = await self._check_members(
+                        target.organization, group, option1, option2, option3, 0
+                    )
+            completed += 1
+            return [
+                SurveyResult(
+                    target, user=user, error=error, completed=completed, total=total
+                )
+                for user, error in outcomes
+            ]
+
+        async for result in run_scheduled(scheduler, handle, concurrency):
+            yield result
+
+    async def check_group(
+        self,
+        organization: Organization,
+        name: str,
+        birthday: str,
+        password: str,
+        option1: bool = False,
+        option2: Union[bool, None] = None,
+        option3: bool = False,
+        concurrency: int = 4,
+    ) -> List[SurveyResult]:
+        """계정에 등록된 모든 유저의 자가진단을 한번의 로그인으로 실행합니다.
+
+        보안 키패드 인증은 한번만 진행하고, 그룹에 속한 유저마다 유저 정보를 가져온 뒤 바로 자가진단을 제출합니다.
+        실패한 유저는 예외 대신 error가 담긴 결과로 반환됩니다. 로그인에 실패한 경우 예외를 발생시킵니다.
+
+        Parameters
+        ----------
+        organization: Organization
+            사용자의 기관 객체를 입력합니다.
+        name: str
+            사용자의 이름을 입력합니다.
+        birthday: str
+            사용자 생년월일 6자리를 입력합니다.
+        password: str
+            사용자 비밀번호 4자리를 입력합니다.
+        option1:
+            옵션 1번입니다. <User>.check 를 참고하세요.
+        option2:
+            옵션 2번입니다. <User>.check 를 참고하세요.
+        option3:
+            옵션 3번입니다. <User>.check 를 참고하세요.
+        concurrency: int
+            동시에 자가진단을 진행할 최대 유저 수를 입력합니다. 기본값은 4 입니다.
+        """
+        account = Account(organization, name, birthday, password)
+        group, _ = await asyncio.gather(
+            self._authenticate(*account), self._prefetch_version()
+        )
+        outcomes = await self._check_members(
+            organization, group, option1, option2, option3, concurrency
+        )
+        return [
+            SurveyResult(
+                account, user=user, error=error, completed=index, total=len(outcomes)
             )
-            for user_data in group
+            for index, (user, error) in enumerate(outcomes, start=1)
         ]
+
+    async def _prefetch_version(self) -> None:
+        # 모든 유저가 같은 클라이언트 버전을 사용하므로 미리 한번만 가져옵니다.
+        self._start_version_refresh()
+        with contextlib.suppress(Exception):
+            await self._http_client.version_resolver.get()
+
+    async def _check_members(
+        self,
+        organization: Organization,
+        group: List[Any],
+        option1: bool,
+        option2: Union[bool, None],
+        option3: bool,
+        concurrency: int,
+    ) -> List[Tuple[Optional[User], Optional[BaseException]]]:
+        """그룹에 속한 유저마다 유저 정보를 가져오고 바로 자가진단을 제출합니다."""
+
+        async def check(
+            user_data: Any,
+        ) -> Tuple[Optional[User], Optional[BaseException]]:
+            user = None
+            try:
+                response = await self._http_client.get_user(
+                    endpoint=organization.endpoint,
+                    code=organization.id,
+                    user_id=user_data["userPNo"],
+                    token=user_data["token"],
+                )
+                user = User(
+                    state=self._http_client,
+                    organization=organization,
+                    token_issued_at=time.time(),
+                    **response,
+                )
+                await self._http_client.check_survey(
+                    endpoint=organization.endpoint,
+                    token=user.token,
+                    option1=option1,
+                    option2=option2,
+                    option3=option3,
+                    log_name=user.name,
+                )
+            except Exception as error:
+                return user, error
+            return user, None
+
+        outcomes = await gather_limited(
+            (check(user_data) for user_data in group), limit=concurrency
+        )
+        self._track([user for user, _ in outcomes if user is not None])
+        return outcomes
+
+    async def _get_group_users(
+        self, organization: Organization, group: List[Any], concurrency: int
+    ) -> List[User]:
+        """그룹에 속한 유저들의 정보를 동시에 가져옵니다.
+
+        일부 유저만 실패한 경우 가져온 유저들과 실패한 유저들의 예외를 담아
+        <PartialFailure> 예외를 발생시킵니다. 모두 실패한 경우 첫번째 예외를 발생시킵니다.
+        """
+        issued_at = time.time()
+        results = await gather_limited(
+            (
+                self._http_client.get_user(
+                    endpoint=organization.endpoint,
+                    code=organization.id,
+                    user_id=user_data["userPNo"],
+                    token=user_data["token"],
+                )
+                for user_data in group
+            ),
+            limit=concurrency,
+            return_exceptions=True,
+        )
+        errors = {
+            index: result
+            for index, result in enumerate(results)
+            if isinstance(result, BaseException)
+        }
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        users = [
+            (
+                result
+                if isinstance(result, BaseException)
+                else User(
+                    state=self._http_client,
+                    organization=organization,
+                    token_issued_at=issued_at,
+                    **result,
+                )
+            )
+            for result in results
+        ]
+        if errors:
+            raise PartialFailure(
+                f"{len(results)}명 중 {len(errors)}명의 유저 정보를 가져오지 못했습니다.",
+                results=self._track(users),
+                errors=errors,
+            )
+        return self._track(users)
+
+    def _track(self, users: List[Any]) -> List[Any]:
+        """토큰 갱신이 설정되어 있으면 유저들의 토큰을 추적합니다."""
+        if self._token_refresher is not None:
+            for user in users:
+                if isinstance(user, User):
+                    self._token_refresher.track(user)
+        return users
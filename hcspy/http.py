@@ -1,10 +1,14 @@
+import asyncio
 import contextlib
+import functools
+from concurrent.futures import Executor
 from json import dumps
-from typing import Any, ClassVar, Dict, Literal, Optional, Union
+from typing import Any, ClassVar, Dict, Literal, Optional, Tuple, Union
 
 import aiohttp
 from bs4 import BeautifulSoup
 
+from .cache import NoticeContentCache
 from .data import school_areas, school_levels
 from .errors import (
     AuthorizeError,
@@ -14,9 +18,12 @@ from .errors import (
     WrongInformationError,
     AccessTokenExpired,
 )
+from .executor import CryptoExecutor, ExecutorMode, create_crypto_executor
 from .keypad import KeyPad
-from .transkey import mTransKey
-from .utils import encrypt_login, multi_finder, url_create_with
+from .transkey import KeyPadPool, TransKeyCache, mTransKey
+from .transport import TransportManager
+from .utils import encrypt_login, encrypt_many, multi_finder, url_create_with
+from .version import ClientVersionResolver, extract_client_version
 
 
 def content_type(response: Any) -> Any:
@@ -48,7 +55,8 @@ class Route:
 class HTTPRequest:
     def __init__(
         self,
-        session: aiohttp.ClientSession = aiohttp.ClientSession(),
+        session: Optional[aiohttp.ClientSession] = None,
+        transport: Optional[TransportManager] = None,
     ):
         """새 http 세션을 생성합니다.
 
@@ -56,10 +64,18 @@ class HTTPRequest:
         ----------
         session: Optional[aiohttp.ClientSession]
             기존 세션을 생성합니다.세션이 없을 경우 요청할 때 새로 생성합니다.
+        transport: Optional[TransportManager]
+            공유할 커넥션 풀을 입력합니다. 입력한 경우 session 파라미터는 무시됩니다.
         """
-        self.session: aiohttp.ClientSession = session
+        if transport is None:
+            transport = TransportManager(session=session)
+        self.transport: TransportManager = transport
         self._cookie_jar = aiohttp.CookieJar()
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.transport.session
+
     @staticmethod
     def set_header(header: Dict[str, str]) -> Dict[str, str]:
         """자가진단 사이트에 필요한 기본 헤더를 생성합니다.
@@ -120,19 +136,105 @@ class HTTPRequest:
 
 
 class HTTPClient:
-    __slots__ = ("_session", "_http")
+    __slots__ = (
+        "_transport",
+        "_http",
+        "_version_resolver",
+        "_transkey_cache",
+        "_keypad_pool",
+        "_crypto_executor",
+        "_notice_cache",
+    )
 
     def __init__(
-        self, session: aiohttp.ClientSession = aiohttp.ClientSession()
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        version_ttl: float = 3600.0,
+        transport: Optional[TransportManager] = None,
+        transkey_cache_ttl: Optional[float] = 600.0,
+        keypad_pool_size: int = 0,
+        keypad_pool_max_age: float = 60.0,
+        crypto_executor: Union[ExecutorMode, CryptoExecutor, Executor, None] = None,
+        notice_cache_size: int = 1024,
+        notice_cache_ttl: Optional[float] = 3600.0,
+        notice_cache_path: Optional[str] = None,
     ) -> None:
-        """새 http client를 세션과 함께 생성합니다"""
-        self._session = session
-        self._http = HTTPRequest(session=self._session)
+        """새 http client를 세션과 함께 생성합니다
+
+        Parameters
+        ----------
+        session: Optional[aiohttp.ClientSession]
+            요청에 사용할 세션을 입력합니다. 비워둘 경우 처음 요청할 때 새로 생성합니다.
+        version_ttl: float
+            자가진단 클라이언트 버전을 캐시할 시간(초)을 입력합니다. 기본값은 3600 입니다.
+        transport: Optional[TransportManager]
+            공유할 커넥션 풀을 입력합니다. 입력한 경우 session 파라미터는 무시됩니다.
+        transkey_cache_ttl: Optional[float]
+            보안 키보드 공개키와 키 좌표를 캐시할 시간(초)을 입력합니다. None일 경우 캐시하지 않습니다.
+        keypad_pool_size: int
+            미리 준비해둘 보안 키패드 수를 입력합니다. 0일 경우 로그인할 때마다 새로 만듭니다.
+        keypad_pool_max_age: float
+            미리 준비한 보안 키패드를 사용할 수 있는 시간(초)을 입력합니다. 기본값은 60 입니다.
+        crypto_executor: Union[str, CryptoExecutor, concurrent.futures.Executor, None]
+            RSA, SEED 암호화를 실행할 방식(inline, thread, process)이나 Executor를 입력합니다.
+            비워둘 경우 이벤트 루프에서 바로 실행합니다.
+        notice_cache_size: int
+            메모리에 캐시할 최대 공지사항 내용 수를 입력합니다. 기본값은 1024 입니다.
+        notice_cache_ttl: Optional[float]
+            공지사항 내용을 캐시할 시간(초)을 입력합니다. None일 경우 캐시하지 않습니다.
+        notice_cache_path: Optional[str]
+            공지사항 내용을 함께 저장할 SQLite 데이터베이스 파일 경로를 입력합니다.
+        """
+        self._crypto_executor = create_crypto_executor(crypto_executor)
+        self._notice_cache: Optional[NoticeContentCache] = (
+            NoticeContentCache(
+                maxsize=notice_cache_size, ttl=notice_cache_ttl, path=notice_cache_path
+            )
+            if notice_cache_ttl
+            else None
+        )
+        if transport is None:
+            transport = TransportManager(session=session)
+        self._transport = transport
+        self._transkey_cache: Optional[TransKeyCache] = (
+            TransKeyCache(ttl=transkey_cache_ttl) if transkey_cache_ttl else None
+        )
+        self._keypad_pool: Optional[KeyPadPool] = (
+            KeyPadPool(
+                self._build_keypad, size=keypad_pool_size, max_age=keypad_pool_max_age
+            )
+            if keypad_pool_size > 0
+            else None
+        )
+        self._http = HTTPRequest(transport=self._transport)
+        self._version_resolver = ClientVersionResolver(
+            self.get_client_version, ttl=version_ttl
+        )
 
     @property
     def http_session(self) -> HTTPRequest:
         return self._http
 
+    @property
+    def transport(self) -> TransportManager:
+        return self._transport
+
+    @property
+    def version_resolver(self) -> ClientVersionResolver:
+        return self._version_resolver
+
+    @property
+    def crypto_executor(self) -> CryptoExecutor:
+        return self._crypto_executor
+
+    @property
+    def keypad_pool(self) -> Optional[KeyPadPool]:
+        return self._keypad_pool
+
+    @property
+    def notice_cache(self) -> Optional[NoticeContentCache]:
+        return self._notice_cache
+
     async def search_organization(
         self,
         search_type: Literal["school", "univ", "office"],
@@ -211,13 +313,16 @@ class HTTPClient:
         """
         route = Route("POST", "/v2/findUser")
         route.endpoint = endpoint
+        encrypted_birthday, encrypted_name = await self._crypto_executor.run(
+            encrypt_many, [birthday, name]
+        )
         try:
             response = await self._http.request(
                 route,
                 json={
-                    "birthday": encrypt_login(birthday),
+                    "birthday": encrypted_birthday,
                     "loginType": organization_type,
-                    "name": encrypt_login(name),
+                    "name": encrypted_name,
                     "orgCode": code,
                     "searchKey": search_key,
                     "stdntPHo": None,
@@ -279,7 +384,8 @@ class HTTPClient:
         """
         if len(password) != 4:
             raise PasswordLengthError("비밀번호는 숫자 4자리만 허용됩니다.")
-        data = {"deviceUuid": "", "password": encrypt_login(password)}
+        encrypted_password = await self._crypto_executor.run(encrypt_login, password)
+        data = {"deviceUuid": "", "password": encrypted_password}
         route = Route("POST", "/v2/registerPassword")
         route.endpoint = endpoint
         response = await self._http.request(
@@ -299,9 +405,11 @@ class HTTPClient:
         route = Route("GET", "/")
         route.endpoint = host
         resource = await self._http.request(route, json={}, headers={})
-        bs4_frame = BeautifulSoup(resource, "html.parser")
-        static_file_href = bs4_frame.head.link["href"]
-        version = str(static_file_href.strip("/").split("/")[-2])
+        version = extract_client_version(resource)
+        if version is None:
+            bs4_frame = BeautifulSoup(resource, "html.parser")
+            static_file_href = bs4_frame.head.link["href"]
+            version = str(static_file_href.strip("/").split("/")[-2])
         return version
 
     async def check_survey(
@@ -337,7 +445,7 @@ class HTTPClient:
             input_data_packed = {False: "0", True: "1"}
             form7_input = input_data_packed[option2]
 
-        version = await self.get_client_version()
+        version = await self._version_resolver.get()
 
         data = {
             "clientVersion": version,
@@ -363,7 +471,6 @@ class HTTPClient:
             "upperToken": token,
             "upperUserNameEncpt": log_name,
         }
-        print(data)
         response = await self._http.request(
             route, json=data, headers={"Authorization": token}
         )
@@ -389,20 +496,38 @@ class HTTPClient:
             raise PasswordLengthError("비밀번호는 숫자 4자리만 허용됩니다.")
         route = Route("POST", "/v2/changePassword")
         route.endpoint = endpoint
+        encrypted_password, encrypted_new_password = await self._crypto_executor.run(
+            encrypt_many, [password, new_password]
+        )
         data = {
-            "password": encrypt_login(password),
-            "newPassword": encrypt_login(new_password),
+            "password": encrypted_password,
+            "newPassword": encrypted_new_password,
         }
         response = await self._http.request(
             route, json=data, headers={"Authorization": token}
         )
         return response
 
+    async def prepare_security_keypad(self) -> Tuple[mTransKey, KeyPad]:
+        """
+        보안 키보드 핸드셰이크를 미리 진행합니다.
+        반환한 키패드는 use_security_keypad의 prepared 파라미터로 한번만 사용할 수 있습니다.
+        """
+        return await self._new_keypad()
+
     async def use_security_keypad(
-        self, endpoint: str, token: str, password: str
+        self,
+        endpoint: str,
+        token: str,
+        password: str,
+        prepared: Optional[Tuple[mTransKey, KeyPad]] = None,
     ) -> Any:
         """보안 키보드를 사용해 서버에 데이터를 요청합니다
 
+        캐시된 transkey 핸드셰이크로 요청이 실패한 경우 캐시를 비우고 한번 더 요청합니다.
+        비밀번호가 틀린 경우(errorCode 1001)에도 캐시를 비우지만, 다시 요청하면 로그인 시도 횟수가
+        한번 더 차감될 수 있으므로 다시 요청하지 않습니다.
+
         Parameters
         ----------
         endpoint: str
@@ -411,12 +536,67 @@ class HTTPClient:
             사용자 토큰을 입력합니다.
         password: str
             사용자 비밀번호 4자리를 입력합니다.
+        prepared: Optional[Tuple[mTransKey, KeyPad]]
+            prepare_security_keypad로 미리 준비한 키패드를 입력합니다. 비워둘 경우 새로 준비합니다.
         """
-        mtk = mTransKey("https://hcs.eduro.go.kr/transkeyServlet")
+        mtk, keypad = prepared or await self._new_keypad()
+        try:
+            response = await self._validate_password(
+                endpoint, token, password, mtk, keypad
+            )
+        except HTTPException:
+            if not mtk.from_cache:
+                raise
+            response = None
+        if not mtk.from_cache or not self._is_error(response):
+            return response
+        self._invalidate_keypads()
+        if self._is_wrong_password(response):
+            # 캐시된 핸드셰이크 때문에 틀렸을 수도 있지만, 다시 요청하면 시도 횟수가 차감될 수 있습니다.
+            return response
+        mtk, keypad = await self._build_keypad()
+        return await self._validate_password(endpoint, token, password, mtk, keypad)
+
+    def _invalidate_keypads(self) -> None:
+        if self._transkey_cache is not None:
+            self._transkey_cache.invalidate()
+        if self._keypad_pool is not None:
+            self._keypad_pool.clear()
+
+    @staticmethod
+    def _is_error(response: Any) -> bool:
+        if response is None:
+            return True
+        return isinstance(response, dict) and response.get("isError") is True
+
+    @staticmethod
+    def _is_wrong_password(response: Any) -> bool:
+        return isinstance(response, dict) and response.get("errorCode") == 1001
+
+    async def _new_keypad(self) -> Tuple[mTransKey, KeyPad]:
+        if self._keypad_pool is not None:
+            return await self._keypad_pool.acquire()
+        return await self._build_keypad()
+
+    async def _build_keypad(self) -> Tuple[mTransKey, KeyPad]:
+        mtk = mTransKey(
+            "https://hcs.eduro.go.kr/transkeyServlet",
+            session=self._http.session,
+            cache=self._transkey_cache,
+            executor=self._crypto_executor,
+        )
         keypad: KeyPad = await mtk.new_keypad(
             "number", "password", "password", "password"
         )
-        encrypted: str = keypad.encrypt_password(password)
+        return mtk, keypad
+
+    async def _validate_password(
+        self, endpoint: str, token: str, password: str, mtk: mTransKey, keypad: KeyPad
+    ) -> Any:
+        encrypted, seed_key = await asyncio.gather(
+            self._crypto_executor.run(keypad.encrypt_password, password),
+            self._crypto_executor.run(mtk.crypto.get_encrypted_key),
+        )
         hm: str = mtk.hmac_digest(encrypted.encode())
         route = Route("POST", "/v2/validatePassword")
         route.endpoint = endpoint
@@ -431,7 +611,7 @@ class HTTPClient:
                             "keyboardType": "number",
                             "keyIndex": mtk.keyIndex,
                             "fieldType": "password",
-                            "seedKey": mtk.crypto.get_encrypted_key(),
+                            "seedKey": seed_key,
                             "initTime": mtk.initTime,
                             "ExE2E": "false",
                         }
@@ -530,7 +710,18 @@ class HTTPClient:
             사용자 토큰을 입력합니다.
         code: str
             공지사항의 글 id를 입력합니다.
+
+        공지사항 내용은 (endpoint, code) 별로 캐시되어 모든 유저가 함께 사용합니다.
         """
+        if self._notice_cache is None:
+            return await self._get_notice_content(endpoint, token, code)
+        return await self._notice_cache.get_or_load(
+            endpoint,
+            code,
+            functools.partial(self._get_notice_content, endpoint, token, code),
+        )
+
+    async def _get_notice_content(self, endpoint: str, token: str, code: str) -> Any:
         url = url_create_with(
             "/v2/selectNotice",
             idxNtc=code,
@@ -605,8 +796,14 @@ class HTTPClient:
 
     async def close(self) -> None:
         """http 세션을 닫습니다"""
-        await self._http.session.close()
+        await self._version_resolver.stop()
+        if self._keypad_pool is not None:
+            await self._keypad_pool.close()
+        if self._notice_cache is not None:
+            self._notice_cache.close()
+        await self._transport.close()
+        self._crypto_executor.shutdown(wait=False)
 
     @property
-    def session(self):
-        return self._session
+    def session(self) -> aiohttp.ClientSession:
+        return self._transport.session
@@ -0,0 +1,374 @@
+import difflib
+import json
+import time
+from bisect import bisect_left
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .data import school_areas, school_levels
+from .errors import OrganizationNotFound
+from .model import Organization
+from .utils import gather_limited, reverse_aliases
+
+if TYPE_CHECKING:
+    from .hcs import HCSClient
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+)  # fmt: skip
+_JONGSEONG = (
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ",
+    "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ",
+    "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)  # fmt: skip
+_COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}  # fmt: skip
+
+INDEX_VERSION = 1
+
+
+def normalize_name(name: str) -> str:
+    """기관 이름에서 공백을 지우고 소문자로 바꿉니다."""
+    return "".join(name.split()).lower()
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    한글 음절을 자모로 분해합니다. (예: "서울" -> "ㅅㅓㅇㅜㄹ")
+    겹받침, 이중모음도 나누므로 입력 중인 글자("서우", "한구")로도 앞부분을 찾을 수 있습니다.
+    """
+    jamo = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            jamo.append(_CHOSEONG[code // 588])
+            jamo.append(_JUNGSEONG[code % 588 // 28])
+            jamo.append(_JONGSEONG[code % 28])
+        else:
+            jamo.append(_COMPOUND_JAMO.get(char, char))
+    return "".join(jamo)
+
+
+def _level_suffixes() -> List[Tuple[str, str]]:
+    # "고", "고등" 처럼 줄여 쓴 학교급 별칭을 정식 이름("고등학교")으로 바꾸기 위한 목록입니다.
+    suffixes = []
+    for alias, code in reverse_aliases(school_levels, "level").items():
+        canonical = school_levels[f"level{code}"][0]
+        if alias != canonical:
+            suffixes.append((alias, canonical))
+    return sorted(suffixes, key=lambda item: len(item[0]), reverse=True)
+
+
+_LEVEL_SUFFIXES = _level_suffixes()
+
+
+def expand_level_alias(name: str) -> Optional[str]:
+    """줄여 쓴 학교급으로 끝나는 이름을 정식 이름으로 바꿉니다. (예: "서울고" -> "서울고등학교")"""
+    for alias, canonical in _LEVEL_SUFFIXES:
+        if name.endswith(alias) and not name.endswith(canonical):
+            return name[: -len(alias)] + canonical
+    return None
+
+
+def _default_queries() -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+    # 유치원은 이름에 "학교"가 없으므로 학교급마다 정식 이름("유치원", "초등학교" 등)으로 검색합니다.
+    queries: List[Tuple[str, str, Optional[str], Optional[str]]] = [
+        (
+            "school",
+            names[0],
+            level_key.replace("level", ""),
+            area_key.replace("area", ""),
+        )
+        for area_key in school_areas
+        for level_key, names in school_levels.items()
+    ]
+    queries.append(("univ", "대학", None, None))
+    queries.append(("office", "교육", None, None))
+    return queries
+
+
+class OrganizationIndex:
+    """
+    기관 정보를 로컬에 저장해 /searchSchool 요청 없이 기관을 찾는 인덱스입니다.
+    이름 앞부분(자모 단위), 자모 유사도, 별칭("서울고", "서울시")으로 찾을 수 있으며 파일로 저장할 수 있습니다.
+
+    인덱스로 찾은 <Organization>은 검색 키가 없으므로, HCSClient가 로그인할 때 한번 검색해 검색 키를 받습니다.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._queries: Dict[str, Dict[str, Any]] = {}
+        self._organizations: Dict[str, Organization] = {}
+        self._names: Dict[str, List[str]] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._jamo: Dict[str, List[str]] = {}
+        self._dirty = False
+
+    def __repr__(self) -> str:
+        return f"<OrganizationIndex organizations={len(self._records)}>"
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._records
+
+    @staticmethod
+    def _query_key(query: Tuple[str, str, Optional[str], Optional[str]]) -> str:
+        return ":".join(part or "" for part in query)
+
+    def add(
+        self,
+        query: Tuple[str, str, Optional[str], Optional[str]],
+        response: Iterable[Dict[str, Any]],
+    ) -> bool:
+        """
+        검색 결과를 인덱스에 반영합니다. 이전 결과에서 사라진 기관은 지우고, 바뀐 내용이 있으면 True를 반환합니다.
+
+        Parameters
+        ----------
+        query: Tuple[str, str, Optional[str], Optional[str]]
+            (search_type, name, 학교급 코드, 지역 코드) 검색어를 입력합니다.
+        response: Iterable[Dict[str, Any]]
+            검색 결과 기관 목록(schulList)을 입력합니다.
+        """
+        search_type, _, level, area = query
+        key = self._query_key(query)
+        previous = set(self._queries.get(key, {}).get("codes", ()))
+        codes = []
+        changed = False
+        for organization_data in response:
+            code = organization_data.get("orgCode")
+            if not code:
+                continue
+            record = {
+                "type": search_type,
+                "level": level,
+                "area": area,
+                "data": dict(organization_data),
+            }
+            if self._records.get(code) != record:
+                self._records[code] = record
+                self._organizations.pop(code, None)
+                changed = True
+            codes.append(code)
+        for code in previous.difference(codes):
+            if any(
+                code in other["codes"]
+                for other_key, other in self._queries.items()
+                if other_key != key
+            ):
+                continue
+            self._records.pop(code, None)
+            self._organizations.pop(code, None)
+            changed = True
+        self._queries[key] = {
+            "query": list(query),
+            "fetched_at": time.time(),
+            "codes": codes,
+        }
+        self._dirty = self._dirty or changed
+        return changed
+
+    def _rebuild(self) -> None:
+        names: Dict[str, List[str]] = {}
+        jamo: Dict[str, List[str]] = {}
+        for code, record in self._records.items():
+            name = normalize_name(record["data"].get("kraOrgNm") or "")
+            if not name:
+                continue
+            names.setdefault(name, []).append(code)
+            jamo.setdefault(decompose_hangul(name), []).append(code)
+        self._names = names
+        self._jamo = jamo
+        self._keys = sorted(
+            (key, code) for key, codes in jamo.items() for code in codes
+        )
+        self._dirty = False
+
+    def get(self, code: str) -> Optional[Organization]:
+        """기관 코드(orgCode)로 기관을 찾습니다."""
+        record = self._records.get(code)
+        if record is None:
+            return None
+        organization = self._organizations.get(code)
+        if organization is None:
+            data = record["data"]
+            organization = self._organizations[code] = Organization(
+                organization_type=record["type"],
+                access_key="",
+                search_query=(record["type"], data.get("kraOrgNm"), None, None),
+                **data,
+            )
+        return organization
+
+    def search(
+        self,
+        name: str,
+        search_type: Optional[str] = None,
+        level: Optional[str] = None,
+        area: Optional[str] = None,
+        limit: int = 10,
+        fuzzy: bool = True,
+    ) -> List[Organization]:
+        """
+        인덱스에서 기관을 찾습니다. 정확히 같은 이름, 별칭을 정식 이름으로 바꾼 이름, 이름 앞부분 순서로 찾고
+        찾지 못하면 자모 유사도로 찾습니다.
+
+        Parameters
+        ----------
+        name: str
+            찾을 기관 이름이나 이름 앞부분을 입력합니다.
+        search_type: Optional[str]
+            기관 타입(school, univ, office)을 입력합니다.
+        level: Optional[str]
+            학교급을 입력합니다. ("고", "고등학교" 등)
+        area: Optional[str]
+            지역을 입력합니다. ("서울", "서울시" 등)
+        limit: int
+            반환할 최대 기관 수를 입력합니다. 기본값은 10 입니다.
+        fuzzy: bool
+            다른 방법으로 찾지 못했을 때 자모 유사도로 찾을지 선택합니다. 기본값은 True 입니다.
+        """
+        if self._dirty:
+            self._rebuild()
+        if level is not None:
+            level = reverse_aliases(school_levels, "level").get(level, level)
+        if area is not None:
+            area = reverse_aliases(school_areas, "area").get(area, area)
+
+        def matches(code: str) -> bool:
+            record = self._records[code]
+            return (
+                (search_type is None or record["type"] == search_type)
+                and (level is None or record["level"] == level)
+                and (area is None or record["area"] == area)
+            )
+
+        query = normalize_name(name)
+        found: Dict[str, None] = {}
+
+        def collect(codes: Iterable[str]) -> bool:
+            for code in codes:
+                if code not in found and matches(code):
+                    found[code] = None
+                    if len(found) >= limit:
+                        return True
+            return False
+
+        expanded = expand_level_alias(query)
+        done = collect(self._names.get(query, ())) or (
+            expanded is not None and collect(self._names.get(expanded, ()))
+        )
+        if not done and query:
+            collect(self._prefix_codes(decompose_hangul(query)))
+        if not found and fuzzy and query:
+            candidates = difflib.get_close_matches(
+                decompose_hangul(query), list(self._jamo), n=limit, cutoff=0.6
+            )
+            collect(code for candidate in candidates for code in self._jamo[candidate])
+        organizations = []
+        for code in found:
+            organization = self.get(code)
+            if organization is not None:
+                organizations.append(organization)
+        return organizations
+
+    def _prefix_codes(self, prefix: str) -> Iterator[str]:
+        for index in range(bisect_left(self._keys, (prefix,)), len(self._keys)):
+            key, code = self._keys[index]
+            if not key.startswith(prefix):
+                return
+            yield code
+
+    async def refresh(
+        self,
+        client: "HCSClient",
+        max_age: float = 86400.0,
+        queries: Optional[
+            Iterable[Tuple[str, str, Optional[str], Optional[str]]]
+        ] = None,
+        concurrency: int = 4,
+    ) -> int:
+        """
+        가져온 지 max_age초가 지난 검색어만 다시 검색해 인덱스를 갱신하고, 다시 검색한 검색어 수를 반환합니다.
+
+        Parameters
+        ----------
+        client: HCSClient
+            검색에 사용할 Client를 입력합니다.
+        max_age: float
+            검색 결과를 다시 가져올 시간(초)을 입력합니다. 기본값은 86400 입니다.
+        queries: Optional[Iterable[Tuple[str, str, Optional[str], Optional[str]]]]
+            (search_type, name, 학교급 코드, 지역 코드) 검색어들을 입력합니다.
+            비워둘 경우 모든 지역, 학교급의 학교와 대학교, 교육행정기관을 검색합니다.
+        concurrency: int
+            동시에 보낼 최대 검색 요청 수를 입력합니다. 기본값은 4 입니다.
+        """
+        now = time.time()
+        stale: List[Tuple[str, str, Optional[str], Optional[str]]] = [
+            (query[0], query[1], query[2], query[3])
+            for query in (queries if queries is not None else _default_queries())
+            if now - self._queries.get(self._query_key(query), {}).get("fetched_at", 0)
+            >= max_age
+        ]
+
+        async def fetch(query: Tuple[str, str, Optional[str], Optional[str]]) -> None:
+            search_type, name, level, area = query
+            try:
+                organizations = await client.search_organization(
+                    search_type,
+                    name,
+                    level=school_levels[f"level{level}"][0] if level else None,
+                    area=school_areas[f"area{area}"][0] if area else None,
+                )
+            except OrganizationNotFound:
+                organizations = []
+            self.add(query, (organization.data for organization in organizations))
+
+        await gather_limited((fetch(query) for query in stale), limit=concurrency)
+        return len(stale)
+
+    async def build(self, client: "HCSClient", concurrency: int = 4) -> None:
+        """모든 지역, 학교급의 기관을 검색해 인덱스를 새로 만듭니다."""
+        await self.refresh(client, max_age=0, concurrency=concurrency)
+
+    def save(self, path: str) -> None:
+        """인덱스를 JSON 파일로 저장합니다."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "records": self._records,
+                    "queries": self._queries,
+                },
+                file,
+                ensure_ascii=False,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "OrganizationIndex":
+        """JSON 파일로 저장한 인덱스를 불러옵니다."""
+        with open(path, encoding="utf-8") as file:
+            payload = json.load(file)
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path} 인덱스 버전을 지원하지 않습니다.")
+        index = cls()
+        index._records = payload["records"]
+        index._queries = payload["queries"]
+        index._dirty = True
+        return index
@@ -43,7 +43,8 @@ class KeyPad:
                 0x30,
             ]
         )
-        out = ""
+        time_bytes = self._time_to_bytes()
+        messages = []
 
         for geo in geos:
             x, y = geo
@@ -51,10 +52,13 @@ class KeyPad:
             xbytes = bytes(map(int, list(x)))
             ybytes = bytes(map(int, list(y)))
 
-            data = b"%b %b %b %%b" % (xbytes, ybytes, self._time_to_bytes())
+            data = b"%b %b %b %%b" % (xbytes, ybytes, time_bytes)
             data += self._randomBytes(48 - len(data))
-            out += "$" + self.crypto.seed_encrypt(iv, data).hex(",")
-        return out
+            messages.append(data)
+        return "".join(
+            "$" + encrypted.hex(",")
+            for encrypted in self.crypto.seed_encrypt_many(iv, messages)
+        )
 
     def encrypt_password(self, pw) -> str:
         geos = self.get_geo(pw)
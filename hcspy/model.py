@@ -1,4 +1,6 @@
-from typing import Any, Dict, Optional, Union
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 
 from .abc import HCSModelABC
 from .http import HTTPClient, Route
@@ -33,11 +35,16 @@ class Organization(BaseHCSModel):
     """
 
     def __init__(
-        self, organization_type: str, access_key: str, **response_data: Any
+        self,
+        organization_type: str,
+        access_key: str,
+        search_query: Optional[Tuple[str, str, Optional[str], Optional[str]]] = None,
+        **response_data: Any,
     ) -> None:
         super().__init__(**response_data)
         self.organization_type = organization_type
         self.access_key = access_key
+        self.search_query = search_query
 
     def __repr__(self) -> str:
         return f"<{self.organization_type.capitalize()} id={self.id} name={self.name} address={self.address} endpoint={self.endpoint}>"
@@ -121,6 +128,25 @@ class Organization(BaseHCSModel):
         """
         return self.access_key
 
+    @property
+    def access_key(self) -> str:
+        """
+        검색 키를 반환합니다. 새 검색 키를 입력하면 발급받은 시간도 함께 기록합니다.
+        """
+        return self._access_key
+
+    @access_key.setter
+    def access_key(self, value: str) -> None:
+        self._access_key = value
+        self._access_key_fetched_at = time.monotonic()
+
+    @property
+    def access_key_age(self) -> float:
+        """
+        검색 키를 발급받은 뒤 지난 시간(초)을 반환합니다.
+        """
+        return time.monotonic() - self._access_key_fetched_at
+
 
 class BoardAuthor(BaseHCSModel):
     """
@@ -160,9 +186,16 @@ class Board(BaseHCSModel):
     자가진단 공지사항을 가져왔을때 반환하는 인스턴스입니다.
     """
 
-    def __init__(self, body_content: str, **response_data: Any) -> None:
+    def __init__(
+        self,
+        body_content: Optional[str] = None,
+        loader: Optional[Callable[[], Awaitable[Optional[str]]]] = None,
+        **response_data: Any,
+    ) -> None:
         super().__init__(**response_data)
         self.body_content = body_content
+        self._loader = loader
+        self._loading: Optional["asyncio.Future[Optional[str]]"] = None
 
     def __repr__(self) -> str:
         return f"<Board id={self.id} title={self.title} author={self.author}>"
@@ -212,10 +245,34 @@ class Board(BaseHCSModel):
         return BoardAuthor(**self.data)
 
     @property
-    def content(self) -> str:
+    def content(self) -> Optional[str]:
         """
         공지사항 글의 내용을 텍스트 형식으로 반환합니다.
+        내용을 아직 가져오지 않았다면 None을 반환합니다. 이 경우 get_content 를 사용하세요.
+        """
+        return self.body_content
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        공지사항 글의 내용을 가져왔는지 반환합니다.
+        """
+        return self.body_content is not None or self._loader is None
+
+    async def get_content(self) -> Optional[str]:
+        """
+        공지사항 글의 내용을 반환합니다. 아직 가져오지 않았다면 처음 호출할 때 한번만 가져옵니다.
         """
+        loader = self._loader
+        if self.body_content is not None or loader is None:
+            return self.body_content
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(loader())
+        try:
+            self.body_content = await asyncio.shield(self._loading)
+        except Exception:
+            self._loading = None
+            raise
         return self.body_content
 
 
@@ -0,0 +1,177 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+import weakref
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+
+from .utils import is_token_expired, token_expires_at
+
+if TYPE_CHECKING:
+    from .user import User
+
+
+class TokenRefresher:
+    """
+    유저 토큰(JWT)의 만료 시간을 추적해 만료되기 전에 미리 토큰을 갱신합니다.
+    갱신한 토큰은 <User> 객체 안에서 바로 교체되므로 유저 객체를 다시 만들 필요가 없습니다.
+    """
+
+    def __init__(
+        self,
+        lead_time: float = 120.0,
+        jitter: float = 30.0,
+        max_concurrency: int = 10,
+        fallback_interval: float = 600.0,
+        retry_interval: float = 30.0,
+        max_retries: Optional[int] = 5,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        lead_time: float
+            토큰 만료 몇 초 전에 갱신할지 입력합니다. 기본값은 120 입니다.
+        jitter: float
+            갱신 시간이 몰리지 않도록 더할 최대 무작위 시간(초)을 입력합니다. 기본값은 30 입니다.
+        max_concurrency: int
+            동시에 진행할 최대 갱신 수를 입력합니다. 기본값은 10 입니다.
+        fallback_interval: float
+            만료 시간을 알 수 없는 토큰을 갱신할 주기(초)를 입력합니다. 기본값은 600 입니다.
+        retry_interval: float
+            갱신에 실패했을 때 다시 시도할 시간(초)을 입력합니다. 기본값은 30 입니다.
+            연속으로 실패할 때마다 두 배씩 늘어나며, 갱신 간격은 항상 이 시간 이상입니다.
+        max_retries: Optional[int]
+            연속으로 실패했을 때 다시 시도할 최대 횟수를 입력합니다. 넘으면 추적을 멈춥니다.
+            이미 만료된 토큰을 받은 경우도 실패로 봅니다. None일 경우 계속 시도합니다. 기본값은 5 입니다.
+        """
+        self.lead_time = lead_time
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.fallback_interval = fallback_interval
+        self.retry_interval = retry_interval
+        self.max_retries = max_retries
+        self._queue: List[Tuple[float, int, "weakref.ref[User]"]] = []
+        self._counter = itertools.count()
+        self._users: "weakref.WeakSet[User]" = weakref.WeakSet()
+        self._failures: "weakref.WeakKeyDictionary[User, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._running: Set["asyncio.Task[None]"] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def __repr__(self) -> str:
+        return f"<TokenRefresher users={len(self._users)} lead_time={self.lead_time}>"
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def next_refresh_at(self, user: "User") -> float:
+        """
+        유저 토큰을 갱신할 시간을 time.time() 기준으로 반환합니다.
+        토큰이 곧 만료되더라도 retry_interval초 이후로 정해 갱신을 반복하지 않게 합니다.
+        """
+        now = time.time()
+        expires_at = token_expires_at(user.token)
+        delay = random.uniform(0, self.jitter) if self.jitter else 0.0
+        if expires_at is None:
+            when = now + self.fallback_interval - delay
+        else:
+            when = expires_at - self.lead_time - delay
+        return max(when, now + self.retry_interval)
+
+    def track(self, user: "User") -> None:
+        """유저 토큰을 추적합니다. 유저 객체가 사라지면 자동으로 추적을 멈춥니다.
+
+        Parameters
+        ----------
+        user: User
+            토큰을 갱신할 유저를 입력합니다.
+        """
+        if user in self._users:
+            return
+        self._users.add(user)
+        self._schedule(user, self.next_refresh_at(user))
+
+    def untrack(self, user: "User") -> None:
+        """유저 토큰 추적을 멈춥니다."""
+        self._users.discard(user)
+        self._failures.pop(user, None)
+
+    def _schedule(self, user: "User", when: float) -> None:
+        heapq.heappush(self._queue, (when, next(self._counter), weakref.ref(user)))
+        self.start()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _retry(self, user: "User") -> None:
+        failures = self._failures.get(user, 0) + 1
+        if self.max_retries is not None and failures > self.max_retries:
+            self.untrack(user)
+            return
+        self._failures[user] = failures
+        delay = self.retry_interval * 2 ** (failures - 1)
+        delay = max(self.retry_interval, min(delay, self.fallback_interval))
+        self._schedule(user, time.time() + delay)
+
+    def start(self) -> None:
+        """백그라운드 갱신을 시작합니다."""
+        if self._task is not None and not self._task.done():
+            return
+        if self._wakeup is None or self._semaphore is None:
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._task = asyncio.ensure_future(self._run(self._wakeup, self._semaphore))
+
+    async def close(self) -> None:
+        """백그라운드 갱신과 진행중인 갱신을 모두 멈춥니다."""
+        tasks = list(self._running)
+        if self._task is not None:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._running.clear()
+
+    async def _run(self, wakeup: asyncio.Event, semaphore: asyncio.Semaphore) -> None:
+        user: Optional["User"] = None
+        while True:
+            wakeup.clear()
+            now = time.time()
+            while self._queue and self._queue[0][0] <= now:
+                _, _, ref = heapq.heappop(self._queue)
+                user = ref()
+                if user is None or user not in self._users or user.is_logout:
+                    continue
+                task = asyncio.ensure_future(self._refresh(user, semaphore))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            # 기다리는 동안 유저 객체가 정리될 수 있도록 참조를 지웁니다.
+            user = None
+            timeout = self._queue[0][0] - now if self._queue else None
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refresh(self, user: "User", semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                await user.refresh_token()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if user in self._users:
+                    self._retry(user)
+                return
+        if user not in self._users or user.is_logout:
+            return
+        if is_token_expired(user.token, margin=0):
+            # 이미 만료된 토큰을 받은 경우 갱신에 실패한 것으로 보고 간격을 늘려 다시 시도합니다.
+            self._retry(user)
+            return
+        self._failures.pop(user, None)
+        self._schedule(user, self.next_refresh_at(user))
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .model import Organization
+
+SearchQuery = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class _SearchEntry:
+    __slots__ = ("organizations", "access_key", "fetched_at")
+
+    def __init__(self, organizations: List[Organization], access_key: str) -> None:
+        self.organizations = organizations
+        self.access_key = access_key
+        self.fetched_at = time.monotonic()
+
+
+class OrganizationCache:
+    """
+    기관 검색 결과를 (search_type, name, level, area) 별로 캐시하고, 검색 키(searchKey)를 관리합니다.
+    같은 검색어는 같은 <Organization> 객체를 반환하므로, 검색 키를 갱신하면 그 기관을 사용하는 모든 곳에 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        fetcher: Callable[[SearchQuery], Awaitable[Tuple[Any, str]]],
+        ttl: Optional[float] = 600.0,
+        key_ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        fetcher: Callable[[SearchQuery], Awaitable[Tuple[Any, str]]]
+            검색어로 (기관 목록, 검색 키)를 가져오는 함수를 입력합니다.
+        ttl: Optional[float]
+            검색 결과를 캐시할 시간(초)을 입력합니다. None일 경우 캐시하지 않습니다.
+        key_ttl: Optional[float]
+            검색 키를 사용할 시간(초)을 입력합니다. 이 시간이 지나면 사용하기 전에 다시 검색합니다.
+            None일 경우 AccessTokenExpired 가 발생했을 때만 다시 검색합니다.
+        """
+        self.ttl = ttl
+        self.key_ttl = key_ttl
+        self._fetcher = fetcher
+        self._entries: Dict[SearchQuery, _SearchEntry] = {}
+        self._pending: Dict[SearchQuery, "asyncio.Future[_SearchEntry]"] = {}
+
+    def __repr__(self) -> str:
+        return f"<OrganizationCache queries={len(self._entries)} ttl={self.ttl}>"
+
+    def _is_fresh(self, entry: _SearchEntry) -> bool:
+        if self.ttl is None:
+            return False
+        age = time.monotonic() - entry.fetched_at
+        return age < self.ttl and (self.key_ttl is None or age < self.key_ttl)
+
+    async def search(self, query: SearchQuery) -> List[Organization]:
+        """
+        기관을 검색합니다. 캐시된 결과가 없거나 만료된 경우에만 요청하며,
+        같은 검색어를 동시에 검색하면 요청은 한번만 보냅니다.
+
+        Parameters
+        ----------
+        query: Tuple[str, str, Optional[str], Optional[str]]
+            (search_type, name, level, area) 검색어를 입력합니다.
+        """
+        entry = self._entries.get(query)
+        if entry is None or not self._is_fresh(entry):
+            entry = await self._fetch(query)
+        return list(entry.organizations)
+
+    async def refresh_key(self, organization: Organization, stale_key: str) -> bool:
+        """
+        만료된 검색 키를 가진 기관을 다시 검색해 검색 키를 갱신합니다.
+        이미 다른 요청이 갱신한 경우 다시 검색하지 않습니다. 갱신에 성공하면 True를 반환합니다.
+
+        Parameters
+        ----------
+        organization: Organization
+            검색 키를 갱신할 기관을 입력합니다.
+        stale_key: str
+            만료된 검색 키를 입력합니다.
+        """
+        if organization.access_key != stale_key:
+            return True
+        query = organization.search_query
+        if query is None:
+            if not organization.name:
+                return False
+            query = (organization.type, organization.name, None, None)
+        entry = await self._fetch(query)
+        if organization.access_key != stale_key:
+            return True
+        for searched in entry.organizations:
+            if searched.id == organization.id:
+                organization.access_key = searched.access_key
+                return True
+        return False
+
+    def is_key_stale(self, organization: Organization) -> bool:
+        """
+        기관의 검색 키를 사용하기 전에 다시 검색해야 하는지 반환합니다.
+        검색 키가 없거나 key_ttl보다 오래된 경우 True를 반환합니다.
+        """
+        if not organization.access_key:
+            return True
+        return self.key_ttl is not None and organization.access_key_age >= self.key_ttl
+
+    def invalidate(self, query: Optional[SearchQuery] = None) -> None:
+        """캐시된 검색 결과를 만료시킵니다. query를 비워두면 모든 결과를 만료시킵니다."""
+        entries = (
+            self._entries.values() if query is None else [self._entries.get(query)]
+        )
+        for entry in entries:
+            if entry is not None:
+                entry.fetched_at = float("-inf")
+
+    async def _fetch(self, query: SearchQuery) -> _SearchEntry:
+        task = self._pending.get(query)
+        if task is None:
+            task = self._pending[query] = asyncio.ensure_future(self._load(query))
+            task.add_done_callback(lambda _: self._pending.pop(query, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, query: SearchQuery) -> _SearchEntry:
+        response, access_key = await self._fetcher(query)
+        previous = self._entries.get(query)
+        known = (
+            {organization.id: organization for organization in previous.organizations}
+            if previous is not None
+            else {}
+        )
+        organizations = []
+        for organization_data in response:
+            organization = known.get(organization_data.get("orgCode"))
+            if organization is None:
+                organization = Organization(
+                    organization_type=query[0],
+                    access_key=access_key,
+                    search_query=query,
+                    **organization_data,
+                )
+            else:
+                # 기존 객체를 그대로 갱신해 이미 기관을 가지고 있는 곳에도 새 검색 키가 반영되게 합니다.
+                organization.data.update(organization_data)
+                organization.access_key = access_key
+            organizations.append(organization)
+        entry = self._entries[query] = _SearchEntry(organizations, access_key)
+        return entry
@@ -1,4 +1,5 @@
 import struct
+from array import array
 
 SS0 = [
     696885672,
@@ -1038,6 +1039,41 @@ SS3 = [
 
 L_ENDIAN = 0
 
+KC = (
+    2654435769,
+    1013904243,
+    2027808486,
+    4055616972,
+    3816266649,
+    3337566003,
+    2380164711,
+    465362127,
+    930724254,
+    1861448508,
+    3722897016,
+    3150826737,
+    2006686179,
+    4013372358,
+    3731777421,
+    3168587547,
+)
+
+_MASK = 4294967295
+_BLOCK = struct.Struct(">LLLL")
+
+# SS0 ^ SS1 를 하위 16비트, SS2 ^ SS3 를 상위 16비트로 합친 G 함수 테이블입니다.
+# 처음 암호화할 때 한번만 만들어집니다.
+_G_LOW = None
+_G_HIGH = None
+
+
+def _g_tables():
+    global _G_LOW, _G_HIGH
+    if _G_LOW is None:
+        _G_LOW = array("I", [SS0[i & 255] ^ SS1[i >> 8] for i in range(65536)])
+        _G_HIGH = array("I", [SS2[i & 255] ^ SS3[i >> 8] for i in range(65536)])
+    return _G_LOW, _G_HIGH
+
 
 def GetDword(buf, off):
     return struct.unpack(">L", buf[off : off + 4])[0]
@@ -1077,157 +1113,102 @@ def endianchange(data):
     return ROL(data, 8, 32) & 16711935 | ROL(data, 24, 32) & 4278255360
 
 
+def _encrypt_words(L0, L1, R0, R1, K, GL, GH):
+    M = _MASK
+    for i in range(0, 32, 4):
+        T0 = R0 ^ K[i]
+        T1 = R1 ^ K[i + 1] ^ T0
+        T1 = GL[T1 & 65535] ^ GH[T1 >> 16]
+        T0 = (T0 + T1) & M
+        T0 = GL[T0 & 65535] ^ GH[T0 >> 16]
+        T1 = (T1 + T0) & M
+        T1 = GL[T1 & 65535] ^ GH[T1 >> 16]
+        L0 ^= (T0 + T1) & M
+        L1 ^= T1
+
+        T0 = L0 ^ K[i + 2]
+        T1 = L1 ^ K[i + 3] ^ T0
+        T1 = GL[T1 & 65535] ^ GH[T1 >> 16]
+        T0 = (T0 + T1) & M
+        T0 = GL[T0 & 65535] ^ GH[T0 >> 16]
+        T1 = (T1 + T0) & M
+        T1 = GL[T1 & 65535] ^ GH[T1 >> 16]
+        R0 ^= (T0 + T1) & M
+        R1 ^= T1
+    return R0, R1, L0, L1
+
+
 class SEED:
     def __init__(self) -> None:
-        self.KC0 = 2654435769
-        self.KC1 = 1013904243
-        self.KC2 = 2027808486
-        self.KC3 = 4055616972
-        self.KC4 = 3816266649
-        self.KC5 = 3337566003
-        self.KC6 = 2380164711
-        self.KC7 = 465362127
-        self.KC8 = 930724254
-        self.KC9 = 1861448508
-        self.KC10 = 3722897016
-        self.KC11 = 3150826737
-        self.KC12 = 2006686179
-        self.KC13 = 4013372358
-        self.KC14 = 3731777421
-        self.KC15 = 3168587547
+        (
+            self.KC0,
+            self.KC1,
+            self.KC2,
+            self.KC3,
+            self.KC4,
+            self.KC5,
+            self.KC6,
+            self.KC7,
+            self.KC8,
+            self.KC9,
+            self.KC10,
+            self.KC11,
+            self.KC12,
+            self.KC13,
+            self.KC14,
+            self.KC15,
+        ) = KC
 
     def SeedEncrypt(self, Src, RoundKey):
-        L0 = []
-        L1 = []
-        R0 = []
-        R1 = []
+        GL, GH = _g_tables()
+        L0, L1, R0, R1 = _BLOCK.unpack(bytes(Src[:16]))
         if L_ENDIAN == 1:
-            L0.append(endianchange(GetDword(Src, 0)))
-            L1.append(endianchange(GetDword(Src, 4)))
-            R0.append(endianchange(GetDword(Src, 8)))
-            R1.append(endianchange(GetDword(Src, 12)))
-        else:
-            L0.append(GetDword(Src, 0))
-            L1.append(GetDword(Src, 4))
-            R0.append(GetDword(Src, 8))
-            R1.append(GetDword(Src, 12))
-        K = RoundKey
-        self.__SeedRound__(L0, L1, R0, R1, K, 0)
-        self.__SeedRound__(R0, R1, L0, L1, K, 2)
-        self.__SeedRound__(L0, L1, R0, R1, K, 4)
-        self.__SeedRound__(R0, R1, L0, L1, K, 6)
-        self.__SeedRound__(L0, L1, R0, R1, K, 8)
-        self.__SeedRound__(R0, R1, L0, L1, K, 10)
-        self.__SeedRound__(L0, L1, R0, R1, K, 12)
-        self.__SeedRound__(R0, R1, L0, L1, K, 14)
-        self.__SeedRound__(L0, L1, R0, R1, K, 16)
-        self.__SeedRound__(R0, R1, L0, L1, K, 18)
-        self.__SeedRound__(L0, L1, R0, R1, K, 20)
-        self.__SeedRound__(R0, R1, L0, L1, K, 22)
-        self.__SeedRound__(L0, L1, R0, R1, K, 24)
-        self.__SeedRound__(R0, R1, L0, L1, K, 26)
-        self.__SeedRound__(L0, L1, R0, R1, K, 28)
-        self.__SeedRound__(R0, R1, L0, L1, K, 30)
+            L0, L1, R0, R1 = map(endianchange, (L0, L1, R0, R1))
+        block = _encrypt_words(L0, L1, R0, R1, RoundKey, GL, GH)
         if L_ENDIAN == 1:
-            return struct.pack(
-                ">LLLL",
-                endianchange(R0[0]),
-                endianchange(R1[0]),
-                endianchange(L0[0]),
-                endianchange(L1[0]),
-            )
-        else:
-            return struct.pack(">LLLL", R0[0], R1[0], L0[0], L1[0])
-
-    def __SeedRound__(self, L0, L1, R0, R1, K, off):
-        T0 = R0[0] ^ K[off + 0]
-        T1 = R1[0] ^ K[off + 1]
-        T1 ^= T0
-        T1 = SS0[GetB0(T1)] ^ SS1[GetB1(T1)] ^ SS2[GetB2(T1)] ^ SS3[GetB3(T1)]
-        T0 += T1
-        T0 &= 4294967295
-        T0 = SS0[GetB0(T0)] ^ SS1[GetB1(T0)] ^ SS2[GetB2(T0)] ^ SS3[GetB3(T0)]
-        T1 += T0
-        T1 &= 4294967295
-        T1 = SS0[GetB0(T1)] ^ SS1[GetB1(T1)] ^ SS2[GetB2(T1)] ^ SS3[GetB3(T1)]
-        T0 += T1
-        T0 &= 4294967295
-        L0[0] ^= T0
-        L1[0] ^= T1
+            block = map(endianchange, block)
+        return _BLOCK.pack(*block)
 
     def SeedRoundKey(self, UserKey):
         if len(UserKey) < 16:
-            UserKey += "\x00" * (16 - len(UserKey))
-        A = []
-        B = []
-        C = []
-        D = []
+            UserKey = bytes(UserKey) + bytes(16 - len(UserKey))
+        GL, GH = _g_tables()
+        A, B, C, D = _BLOCK.unpack(bytes(UserKey[:16]))
         if L_ENDIAN == 1:
-            A.append(endianchange(GetDword(UserKey, 0)))
-            B.append(endianchange(GetDword(UserKey, 4)))
-            C.append(endianchange(GetDword(UserKey, 8)))
-            D.append(endianchange(GetDword(UserKey, 12)))
-        else:
-            A.append(GetDword(UserKey, 0))
-            B.append(GetDword(UserKey, 4))
-            C.append(GetDword(UserKey, 8))
-            D.append(GetDword(UserKey, 12))
+            A, B, C, D = map(endianchange, (A, B, C, D))
+        M = _MASK
         RoundKey = []
-        for i in range(32):
-            RoundKey.append(0)
-
-        K = RoundKey
-        self.__RoundKeyUpdate0__(K, 0, A, B, C, D, self.KC0)
-        self.__RoundKeyUpdate1__(K, 2, A, B, C, D, self.KC1)
-        self.__RoundKeyUpdate0__(K, 4, A, B, C, D, self.KC2)
-        self.__RoundKeyUpdate1__(K, 6, A, B, C, D, self.KC3)
-        self.__RoundKeyUpdate0__(K, 8, A, B, C, D, self.KC4)
-        self.__RoundKeyUpdate1__(K, 10, A, B, C, D, self.KC5)
-        self.__RoundKeyUpdate0__(K, 12, A, B, C, D, self.KC6)
-        self.__RoundKeyUpdate1__(K, 14, A, B, C, D, self.KC7)
-        self.__RoundKeyUpdate0__(K, 16, A, B, C, D, self.KC8)
-        self.__RoundKeyUpdate1__(K, 18, A, B, C, D, self.KC9)
-        self.__RoundKeyUpdate0__(K, 20, A, B, C, D, self.KC10)
-        self.__RoundKeyUpdate1__(K, 22, A, B, C, D, self.KC11)
-        self.__RoundKeyUpdate0__(K, 24, A, B, C, D, self.KC12)
-        self.__RoundKeyUpdate1__(K, 26, A, B, C, D, self.KC13)
-        self.__RoundKeyUpdate0__(K, 28, A, B, C, D, self.KC14)
-        T0 = A[0] + C[0] - self.KC15
-        T1 = B[0] - D[0] + self.KC15
-        K[30] = SS0[GetB0(T0)] ^ SS1[GetB1(T0)] ^ SS2[GetB2(T0)] ^ SS3[GetB3(T0)]
-        K[31] = SS0[GetB0(T1)] ^ SS1[GetB1(T1)] ^ SS2[GetB2(T1)] ^ SS3[GetB3(T1)]
-        for i in range(32):
-            RoundKey[i] &= 4294967295
-
+        for i in range(16):
+            T0 = (A + C - KC[i]) & M
+            T1 = (B + KC[i] - D) & M
+            RoundKey.append(GL[T0 & 65535] ^ GH[T0 >> 16])
+            RoundKey.append(GL[T1 & 65535] ^ GH[T1 >> 16])
+            if i % 2 == 0:
+                A, B = (A >> 8 ^ (B & 255) << 24) & M, (B >> 8 ^ (A & 255) << 24) & M
+            else:
+                C, D = (C << 8 ^ D >> 24) & M, (D << 8 ^ C >> 24) & M
         return RoundKey
 
-    def __RoundKeyUpdate0__(self, K, off, A, B, C, D, KC):
-        T0 = A[0] + C[0] - KC & 4294967295
-        T1 = B[0] + KC - D[0] & 4294967295
-        K[off + 0] = SS0[GetB0(T0)] ^ SS1[GetB1(T0)] ^ SS2[GetB2(T0)] ^ SS3[GetB3(T0)]
-        K[off + 1] = SS0[GetB0(T1)] ^ SS1[GetB1(T1)] ^ SS2[GetB2(T1)] ^ SS3[GetB3(T1)]
-        T0 = A[0]
-        A[0] = (A[0] >> 8 ^ (B[0] & 255) << 24) & 4294967295
-        B[0] = (B[0] >> 8 ^ (T0 & 255) << 24) & 4294967295
-
-    def __RoundKeyUpdate1__(self, K, off, A, B, C, D, KC):
-        T0 = A[0] + C[0] - KC & 4294967295
-        T1 = B[0] + KC - D[0] & 4294967295
-        K[off + 0] = SS0[GetB0(T0)] ^ SS1[GetB1(T0)] ^ SS2[GetB2(T0)] ^ SS3[GetB3(T0)]
-        K[off + 1] = SS0[GetB0(T1)] ^ SS1[GetB1(T1)] ^ SS2[GetB2(T1)] ^ SS3[GetB3(T1)]
-        T0 = C[0]
-        C[0] = (C[0] << 8 ^ D[0] >> 24) & 4294967295
-        D[0] = (D[0] << 8 ^ T0 >> 24) & 4294967295
-
     def my_cbc_encrypt(self, inData, k, iv):
-        prev = iv
-        enced = b""
-
-        for i in range(0, len(inData), 16):
-            xored = []
-            for j in range(0, 16):
-                xored.append(prev[j] ^ inData[i + j])
-            enc = self.SeedEncrypt(bytes(xored), k)
-            enced += enc
-            prev = enc
-        return enced
+        GL, GH = _g_tables()
+        data = memoryview(bytes(inData))
+        if len(data) % 16:
+            raise ValueError("inData length must be a multiple of 16")
+        enced = bytearray(len(data))
+        prev = int.from_bytes(iv[:16], "big")
+        for i in range(0, len(enced), 16):
+            block = int.from_bytes(data[i : i + 16], "big") ^ prev
+            L0 = block >> 96
+            L1 = block >> 64 & _MASK
+            R0 = block >> 32 & _MASK
+            R1 = block & _MASK
+            if L_ENDIAN == 1:
+                L0, L1, R0, R1 = map(endianchange, (L0, L1, R0, R1))
+                R0, R1, L0, L1 = map(
+                    endianchange, _encrypt_words(L0, L1, R0, R1, k, GL, GH)
+                )
+            else:
+                R0, R1, L0, L1 = _encrypt_words(L0, L1, R0, R1, k, GL, GH)
+            _BLOCK.pack_into(enced, i, R0, R1, L0, L1)
+            prev = R0 << 96 | R1 << 64 | L0 << 32 | L1
+        return bytes(enced)
@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .abc import TokenStoreABC, WatermarkStoreABC
+from .model import Organization
+from .utils import is_token_expired, token_expires_at
+
+
+class TokenEntry(NamedTuple):
+    """계정별로 저장하는 자가진단 토큰입니다.
+
+    find_token은 findUser, group_token은 validatePassword 에서 발급받은 토큰입니다.
+    password_digest는 group_token을 발급받을 때 사용한 비밀번호의 salt가 포함된 해시입니다.
+    """
+
+    find_token: Optional[str] = None
+    group_token: Optional[str] = None
+    password_digest: Optional[str] = None
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """group_token의 만료 시간을 unix timestamp로 반환합니다."""
+        return token_expires_at(self.group_token)
+
+    @property
+    def is_expired(self) -> bool:
+        """저장된 토큰을 모두 사용할 수 없는지 반환합니다."""
+        return is_token_expired(self.group_token) and is_token_expired(self.find_token)
+
+    def check_password(self, password: str) -> bool:
+        """비밀번호가 토큰을 발급받을 때 사용한 비밀번호와 같은지 반환합니다."""
+        return verify_password(password, self.password_digest)
+
+
+def account_key(organization: Organization, name: str, birthday: str) -> str:
+    """
+    토큰 저장소에서 사용할 계정 키를 반환합니다.
+    개인정보를 그대로 저장하지 않도록 sha256 해시를 사용합니다.
+    """
+    raw = f"{organization.type}:{organization.id}:{name}:{birthday}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def password_digest(password: str, salt: Optional[bytes] = None) -> str:
+    """
+    토큰 저장소에 저장할 비밀번호 해시를 "salt$hash" 형식으로 반환합니다.
+    salt를 비워두면 새로 만듭니다. CPU를 사용하므로 HCSClient는 crypto_executor 에서 실행합니다.
+    """
+    salt = salt if salt is not None else os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 10000)
+    return f"{salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, digest: Optional[str]) -> bool:
+    """비밀번호가 password_digest로 만든 해시와 같은지 반환합니다."""
+    if not digest or "$" not in digest:
+        return False
+    salt, _ = digest.split("$", 1)
+    try:
+        expected = password_digest(password, bytes.fromhex(salt))
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected, digest)
+
+
+class MemoryTokenStore(TokenStoreABC):
+    """프로세스 메모리에 토큰을 저장합니다."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, TokenEntry] = {}
+
+    def __repr__(self) -> str:
+        return f"<MemoryTokenStore size={len(self._entries)}>"
+
+    async def get(self, key: str) -> Optional[TokenEntry]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, entry: TokenEntry) -> None:
+        self._entries[key] = entry
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class SQLiteTokenStore(TokenStoreABC):
+    """SQLite 파일에 토큰을 저장합니다. 프로세스를 다시 실행해도 토큰을 재사용할 수 있습니다."""
+
+    def __init__(self, path: str = "hcspy_tokens.sqlite3") -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            SQLite 데이터베이스 파일 경로를 입력합니다. 기본값은 hcspy_tokens.sqlite3 입니다.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "key TEXT PRIMARY KEY, find_token TEXT, group_token TEXT, "
+                "updated_at REAL NOT NULL, password_digest TEXT)"
+            )
+            columns = [
+                row[1] for row in self._connection.execute("PRAGMA table_info(tokens)")
+            ]
+            if "password_digest" not in columns:
+                # 이전 버전에서 만든 파일에는 비밀번호 해시 컬럼이 없습니다.
+                self._connection.execute(
+                    "ALTER TABLE tokens ADD COLUMN password_digest TEXT"
+                )
+
+    def __repr__(self) -> str:
+        return f"<SQLiteTokenStore path={self.path}>"
+
+    def _execute(self, query: str, *params: object) -> List[Any]:
+        with self._lock:
+            # close()와 동시에 실행될 수 있으므로 잠금을 잡은 뒤 연결을 확인합니다.
+            connection = self._connection
+            if connection is None:
+                return []
+            with connection:
+                return connection.execute(query, params).fetchall()
+
+    async def get(self, key: str) -> Optional[TokenEntry]:
+        rows = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._execute,
+            "SELECT find_token, group_token, password_digest FROM tokens WHERE key = ?",
+            key,
+        )
+        if not rows:
+            return None
+        return TokenEntry(*rows[0])
+
+    async def set(self, key: str, entry: TokenEntry) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._execute,
+            "INSERT OR REPLACE INTO tokens "
+            "(key, find_token, group_token, updated_at, password_digest) "
+            "VALUES (?, ?, ?, ?, ?)",
+            key,
+            entry.find_token,
+            entry.group_token,
+            time.time(),
+            entry.password_digest,
+        )
+
+    async def delete(self, key: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._execute, "DELETE FROM tokens WHERE key = ?", key
+        )
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class NoticeWatermark(NamedTuple):
+    """호스트별로 마지막으로 확인한 공지사항 위치입니다."""
+
+    last_id: int
+    last_created_at: Optional[str] = None
+
+    def is_new(self, board_data: Dict[str, Any]) -> bool:
+        """공지사항이 이 위치 이후에 올라온 글인지 반환합니다."""
+        if int(board_data["idxNtc"]) > self.last_id:
+            return True
+        created_at = board_data.get("cretDtm")
+        return bool(
+            created_at and self.last_created_at and created_at > self.last_created_at
+        )
+
+    def advance(self, board_data: Dict[str, Any]) -> "NoticeWatermark":
+        """공지사항을 반영해 더 최근 위치를 반환합니다."""
+        created_at = board_data.get("cretDtm")
+        return NoticeWatermark(
+            last_id=max(self.last_id, int(board_data["idxNtc"])),
+            last_created_at=max(
+                filter(None, (self.last_created_at, created_at)), default=None
+            ),
+        )
+
+
+class MemoryWatermarkStore(WatermarkStoreABC):
+    """프로세스 메모리에 공지사항 위치를 저장합니다."""
+
+    def __init__(self) -> None:
+        self._watermarks: Dict[str, NoticeWatermark] = {}
+
+    def __repr__(self) -> str:
+        return f"<MemoryWatermarkStore size={len(self._watermarks)}>"
+
+    async def get(self, key: str) -> Optional[NoticeWatermark]:
+        return self._watermarks.get(key)
+
+    async def set(self, key: str, watermark: NoticeWatermark) -> None:
+        self._watermarks[key] = watermark
+
+
+class SQLiteWatermarkStore(WatermarkStoreABC):
+    """SQLite 파일에 공지사항 위치를 저장합니다. 프로세스를 다시 실행해도 이어서 동기화할 수 있습니다."""
+
+    def __init__(self, path: str = "hcspy_notices.sqlite3") -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            SQLite 데이터베이스 파일 경로를 입력합니다. 기본값은 hcspy_notices.sqlite3 입니다.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS notice_watermarks ("
+                "key TEXT PRIMARY KEY, last_id INTEGER NOT NULL, "
+                "last_created_at TEXT, updated_at REAL NOT NULL)"
+            )
+
+    def __repr__(self) -> str:
+        return f"<SQLiteWatermarkStore path={self.path}>"
+
+    def _execute(self, query: str, *params: object) -> List[Any]:
+        with self._lock:
+            # close()와 동시에 실행될 수 있으므로 잠금을 잡은 뒤 연결을 확인합니다.
+            connection = self._connection
+            if connection is None:
+                return []
+            with connection:
+                return connection.execute(query, params).fetchall()
+
+    async def get(self, key: str) -> Optional[NoticeWatermark]:
+        rows = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._execute,
+            "SELECT last_id, last_created_at FROM notice_watermarks WHERE key = ?",
+            key,
+        )
+        if not rows:
+            return None
+        return NoticeWatermark(*rows[0])
+
+    async def set(self, key: str, watermark: NoticeWatermark) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._execute,
+            "INSERT OR REPLACE INTO notice_watermarks VALUES (?, ?, ?, ?)",
+            key,
+            watermark.last_id,
+            watermark.last_created_at,
+            time.time(),
+        )
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -1,14 +1,86 @@
+import asyncio
 import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 import aiohttp
 
 from . import crypto
+from .executor import CryptoExecutor
 from .keypad import KeyPad
+from .utils import run_stages
+
+_TOKEN_PATTERN = re.compile("var TK_requestToken=(.*);")
+_INIT_TIME_PATTERN = re.compile("var initTime='(.*)';")
+_KEY_POINT_PATTERN = re.compile(r"key\.addPoint\((\d+), (\d+)\);")
+
+
+def parse_key_info(key_data: str) -> Tuple[List, List]:
+    """getKeyInfo 응답에서 qwerty, number 키 좌표를 추출합니다."""
+    qwerty, num = key_data.split("var number = new Array();")
+    qwerty_keys = [
+        _KEY_POINT_PATTERN.search(p).groups()
+        for p in qwerty.split("qwertyMobile.push(key);")[:-1]
+    ]
+    number_keys = [
+        _KEY_POINT_PATTERN.search(p).groups()
+        for p in num.split("number.push(key);")[:-1]
+    ]
+    return qwerty_keys, number_keys
+
+
+class TransKeyCache:
+    """
+    여러 로그인에서 재사용할 수 있는 transkey 핸드셰이크 결과를 캐시합니다.
+    요청 토큰과 서블릿 공개키만 저장하며, 키 좌표(getKeyInfo)는 키패드마다 새로 받습니다.
+    """
+
+    def __init__(self, ttl: float = 600.0) -> None:
+        self.ttl = ttl
+        self.token = ""
+        self.public_key = None
+        self._expires_at = 0.0
+
+    def __repr__(self) -> str:
+        return f"<TransKeyCache ttl={self.ttl} is_valid={self.is_valid}>"
+
+    @property
+    def is_valid(self) -> bool:
+        return self.public_key is not None and time.monotonic() < self._expires_at
+
+    def store(self, token, public_key) -> None:
+        self.token = token
+        self.public_key = public_key
+        self._expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self) -> None:
+        self.public_key = None
+        self._expires_at = 0.0
 
 
 class mTransKey:
-    def __init__(self, servlet_url) -> None:
+    def __init__(
+        self,
+        servlet_url,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[TransKeyCache] = None,
+        executor: Optional[CryptoExecutor] = None,
+    ) -> None:
         self.servlet_url = servlet_url
+        self.session = session
+        self.cache = cache
+        self.executor = executor or CryptoExecutor()
         self.crypto = crypto.Crypto()
         self.token = ""
         self.initTime = ""
@@ -16,23 +88,63 @@ class mTransKey:
         self.qwerty = []
         self.number = []
         self.keyIndex = ""
+        self.from_cache = False
+        self.timings: Dict[str, Tuple[float, float]] = {}
 
-    async def _get_data(self) -> None:
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self.session is not None and not self.session.closed:
+            yield self.session
+            return
         async with aiohttp.ClientSession() as session:
-            await self._get_token(session)
-            await self._get_init_time(session)
-            await self._get_public_key(session)
-            await self._get_key_info(session)
+            yield session
+
+    def _stages(self, session: aiohttp.ClientSession, name, inputName, fieldType):
+        """
+        핸드셰이크 단계별 (의존하는 단계, 실행 함수)를 반환합니다.
+        getToken과 getInitTime 은 서로 의존하지 않아 동시에 실행됩니다.
+        getKeyIndex 는 세션 키가 등록된 뒤 보내야 하므로 항상 getKeyInfo 다음에 실행합니다.
+
+        캐시된 요청 토큰과 서블릿 공개키가 있으면 getToken, getPublicKey 를 생략합니다.
+        세션 키(uuid)는 키패드마다 새로 만들기 때문에 getKeyInfo 는 항상 보냅니다.
+        """
+        stages = {
+            "getInitTime": ((), lambda _: self._get_init_time(session)),
+            "getKeyInfo": ((), lambda _: self._get_key_info(session)),
+            "getKeyIndex": (
+                ("getInitTime", "getKeyInfo"),
+                lambda _: self._get_key_index(session),
+            ),
+            "getDummy": (
+                ("getKeyIndex",),
+                lambda _: self._get_dummy(session, name, inputName, fieldType),
+            ),
+        }
+        if self.cache is not None and self.cache.is_valid:
+            self.token = self.cache.token
+            self.crypto.key = self.cache.public_key
+            self.from_cache = True
+            return stages
+        stages["getToken"] = ((), lambda _: self._get_token(session))
+        stages["getPublicKey"] = (
+            ("getToken",),
+            lambda _: self._get_public_key(session),
+        )
+        stages["getKeyInfo"] = (
+            ("getPublicKey",),
+            lambda _: self._get_key_info(session),
+        )
+        return stages
 
     async def _get_token(self, session: aiohttp.ClientSession):
         async with session.get("{}?op=getToken".format(self.servlet_url)) as resp:
             txt = await resp.text()
-            self.token = re.findall("var TK_requestToken=(.*);", txt)[0]
+            self.token = _TOKEN_PATTERN.findall(txt)[0]
 
     async def _get_init_time(self, session: aiohttp.ClientSession):
         async with session.get("{}?op=getInitTime".format(self.servlet_url)) as resp:
             txt = await resp.text()
-            self.initTime = re.findall("var initTime='(.*)';", txt)[0]
+            self.initTime = _INIT_TIME_PATTERN.findall(txt)[0]
 
     async def _get_public_key(self, session: aiohttp.ClientSession):
         async with session.post(
@@ -42,11 +154,12 @@ class mTransKey:
             self.crypto.set_pub_key(key)
 
     async def _get_key_info(self, session: aiohttp.ClientSession):
+        encrypted_key = await self.executor.run(self.crypto.get_encrypted_key)
         async with session.post(
             self.servlet_url,
             data={
                 "op": "getKeyInfo",
-                "key": self.crypto.get_encrypted_key(),
+                "key": encrypted_key,
                 "transkeyUuid": self.crypto.uuid,
                 "useCert": "true",
                 "TK_requestToken": self.token,
@@ -54,76 +167,192 @@ class mTransKey:
             },
         ) as resp:
             key_data = await resp.text()
-            qwerty, num = key_data.split("var number = new Array();")
-
-            qwerty_keys = []
-            number_keys = []
+            self.qwerty, self.number = parse_key_info(key_data)
 
-            for p in qwerty.split("qwertyMobile.push(key);")[:-1]:
-                points = re.findall("key\.addPoint\((\d+), (\d+)\);", p)
-                qwerty_keys.append(points[0])
-
-            for p in num.split("number.push(key);")[:-1]:
-                points = re.findall("key\.addPoint\((\d+), (\d+)\);", p)
-                number_keys.append(points[0])
+    async def _get_key_index(self, session: aiohttp.ClientSession):
+        async with session.post(
+            self.servlet_url,
+            data={
+                "op": "getKeyIndex",
+                "name": "password",
+                "keyType": "single",
+                "keyboardType": "number",
+                "fieldType": "password",
+                "inputName": "password",
+                "parentKeyboard": "false",
+                "transkeyUuid": self.crypto.uuid,
+                "exE2E": "false",
+                "TK_requestToken": self.token,
+                "isCrt": "false",
+                "allocationIndex": "3011907012",
+                "keyIndex": "",
+                "initTime": self.initTime,
+                "talkBack": "true",
+            },
+        ) as resp:
+            self.keyIndex = await resp.text()
 
-            self.qwerty = qwerty_keys
-            self.number = number_keys
+    async def _get_dummy(
+        self, session: aiohttp.ClientSession, name, inputName, fieldType
+    ):
+        async with session.post(
+            self.servlet_url,
+            data={
+                "op": "getDummy",
+                "name": name,
+                "keyType": "single",
+                "keyboardType": "number",
+                "fieldType": fieldType,
+                "inputName": inputName,
+                "transkeyUuid": self.crypto.uuid,
+                "exE2E": "false",
+                "isCrt": "false",
+                "allocationIndex": "3011907012",
+                "keyIndex": self.keyIndex,
+                "initTime": self.initTime,
+                "TK_requestToken": self.token,
+                "dummy": "undefined",
+                "talkBack": "true",
+            },
+        ) as resp:
+            skip_data = await resp.text()
+            return skip_data.split(",")
 
     async def new_keypad(
         self, key_type, name, inputName, fieldType="password"
     ) -> KeyPad:
-        await self._get_data()
-        async with aiohttp.ClientSession() as session:
-            key_index_res = await session.post(
-                self.servlet_url,
-                data={
-                    "op": "getKeyIndex",
-                    "name": "password",
-                    "keyType": "single",
-                    "keyboardType": "number",
-                    "fieldType": "password",
-                    "inputName": "password",
-                    "parentKeyboard": "false",
-                    "transkeyUuid": self.crypto.uuid,
-                    "exE2E": "false",
-                    "TK_requestToken": self.token,
-                    "isCrt": "false",
-                    "allocationIndex": "3011907012",
-                    "keyIndex": "",
-                    "initTime": self.initTime,
-                    "talkBack": "true",
-                },
+        self.timings = {}
+        async with self._session() as session:
+            results = await run_stages(
+                self._stages(session, name, inputName, fieldType), self.timings
             )
-            self.keyIndex = await key_index_res.text()
-
-            async with session.post(
-                self.servlet_url,
-                data={
-                    "op": "getDummy",
-                    "name": name,
-                    "keyType": "single",
-                    "keyboardType": "number",
-                    "fieldType": fieldType,
-                    "inputName": inputName,
-                    "transkeyUuid": self.crypto.uuid,
-                    "exE2E": "false",
-                    "isCrt": "false",
-                    "allocationIndex": "3011907012",
-                    "keyIndex": self.keyIndex,
-                    "initTime": self.initTime,
-                    "TK_requestToken": self.token,
-                    "dummy": "undefined",
-                    "talkBack": "true",
-                },
-            ) as resp:
-                skip_data = await resp.text()
-                skip = skip_data.split(",")
-
-                return KeyPad(self.crypto, key_type, skip, self.number, self.initTime)
+        if self.cache is not None and not self.from_cache:
+            self.cache.store(self.token, self.crypto.key)
+        return KeyPad(
+            self.crypto, key_type, results["getDummy"], self.number, self.initTime
+        )
+
+    @property
+    def elapsed(self) -> float:
+        """마지막 핸드셰이크의 전체 소요 시간(초)을 반환합니다."""
+        if not self.timings:
+            return 0.0
+        return max(start + duration for start, duration in self.timings.values())
 
     def hmac_digest(self, message: bytes) -> str:
         return self.crypto.hmac_digest(message)
 
     def get_uuid(self) -> str:
         return self.crypto.uuid
+
+
+class KeyPadPool:
+    """
+    미리 핸드셰이크를 마친 (mTransKey, KeyPad) 쌍을 보관하는 풀입니다.
+    꺼낸 키패드는 백그라운드에서 다시 채워지며, max_age가 지난 키패드는 버려집니다.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Tuple[mTransKey, KeyPad]]],
+        size: int = 4,
+        max_age: float = 60.0,
+    ) -> None:
+        self.factory = factory
+        self.size = size
+        self.max_age = max_age
+        self._items: Deque[Tuple[float, Tuple[mTransKey, KeyPad]]] = deque()
+        self._pending = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"<KeyPadPool size={self.size} ready={len(self)} max_age={self.max_age}>"
+
+    def __len__(self) -> int:
+        self._discard_expired()
+        return len(self._items)
+
+    def _discard_expired(self) -> None:
+        deadline = time.monotonic() - self.max_age
+        while self._items and self._items[0][0] <= deadline:
+            self._items.popleft()
+
+    async def acquire(self) -> Tuple[mTransKey, KeyPad]:
+        """
+        준비된 키패드를 꺼냅니다. 준비된 키패드가 없으면 바로 새로 만듭니다.
+        """
+        self.start()
+        self._discard_expired()
+        if self._items:
+            _, item = self._items.popleft()
+            self._wakeup.set()
+            return item
+        self._wakeup.set()
+        return await self.factory()
+
+    async def fill(self) -> None:
+        """풀이 가득 찰 때까지 키패드를 만듭니다."""
+        self._discard_expired()
+        missing = self.size - len(self._items) - self._pending
+        if missing <= 0:
+            return
+        self._pending += missing
+        try:
+            results = await asyncio.gather(
+                *(self.factory() for _ in range(missing)), return_exceptions=True
+            )
+        finally:
+            self._pending -= missing
+        created_at = time.monotonic()
+        errors = [result for result in results if isinstance(result, BaseException)]
+        self._items.extend(
+            (created_at, result)
+            for result in results
+            if not isinstance(result, BaseException)
+        )
+        if errors:
+            raise errors[0]
+
+    def clear(self) -> None:
+        """준비된 키패드를 모두 버립니다."""
+        self._items.clear()
+
+    def start(self) -> None:
+        """백그라운드에서 풀을 채우기 시작합니다."""
+        if self._task is not None and not self._task.done():
+            return
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def close(self) -> None:
+        """백그라운드 작업을 멈추고 풀을 비웁니다."""
+        self.clear()
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.fill()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 서블릿 요청이 실패하면 잠시 기다린 뒤 다시 채웁니다.
+                await asyncio.sleep(1.0)
+                continue
+            timeout = None
+            if self._items:
+                timeout = self._items[0][0] + self.max_age - time.monotonic()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,94 @@
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+
+class TransportManager:
+    """여러 유저가 함께 사용하는 http 커넥션 풀을 관리합니다.
+
+    세션은 처음 요청할 때 생성되며, 같은 TransportManager를 사용하는 모든 요청이
+    하나의 커넥션 풀을 공유합니다.
+    """
+
+    __slots__ = (
+        "_session",
+        "_owns_session",
+        "limit",
+        "limit_per_host",
+        "keepalive_timeout",
+        "ttl_dns_cache",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        session: Optional[aiohttp.ClientSession]
+            기존 세션을 사용합니다. 이 경우 아래 커넥션 옵션은 무시되며 세션을 닫지 않습니다.
+        limit: int
+            전체 커넥션 풀의 최대 크기를 입력합니다. 0일 경우 제한하지 않습니다. 기본값은 100 입니다.
+        limit_per_host: int
+            호스트(atptOfcdcConctUrl)별 최대 커넥션 수를 입력합니다. 0일 경우 제한하지 않습니다.
+        keepalive_timeout: float
+            사용하지 않는 커넥션을 유지할 시간(초)을 입력합니다. 기본값은 30 입니다.
+        ttl_dns_cache: Optional[int]
+            DNS 조회 결과를 캐시할 시간(초)을 입력합니다. None일 경우 만료되지 않습니다.
+        timeout: Optional[float]
+            요청 전체 타임아웃(초)을 입력합니다. 비워둘 경우 aiohttp 기본값을 사용합니다.
+        """
+        self._session = session
+        self._owns_session = session is None
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return (
+            f"<TransportManager limit={self.limit} limit_per_host={self.limit_per_host} "
+            f"is_open={self.is_open}>"
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """세션이 생성되어 있고 닫히지 않았는지 반환합니다."""
+        return self._session is not None and not self._session.closed
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """공유 세션을 반환합니다. 세션이 없거나 닫힌 경우 새로 생성합니다."""
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = self._create_session()
+            self._owns_session = True
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        kwargs: Dict[str, Any] = {}
+        if self.timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=self.timeout)
+        return aiohttp.ClientSession(connector=connector, **kwargs)
+
+    async def close(self) -> None:
+        """직접 생성한 세션을 닫습니다. 외부에서 입력받은 세션은 닫지 않습니다."""
+        if self._session is None:
+            return
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -1,4 +1,7 @@
-from typing import Any, Optional, Union, List
+import asyncio
+import functools
+import time
+from typing import Any, AsyncIterator, Optional, Union, List
 
 from .model import (
     BaseHCSModel,
@@ -8,9 +11,19 @@ from .model import (
     Hospital,
     Covid19Guideline,
 )
-from .utils import duplicate, duplicated
+from .utils import (
+    duplicate,
+    duplicated,
+    gather_limited,
+    is_token_expired,
+    token_expires_at,
+)
 from .http import HTTPClient
-from .errors import AlreadyAgreed
+from .abc import WatermarkStoreABC
+from .errors import AlreadyAgreed, HTTPException
+from .store import NoticeWatermark
+
+AUTH_ERROR_STATUSES = (401, 403)
 
 
 @duplicated
@@ -19,13 +32,22 @@ class User(BaseHCSModel):
     로그인으로 유저 데이터를 가져왔을때 반환하는 인스턴스입니다.
     """
 
+    #: 만료 시간을 알 수 없는 토큰을 새 토큰으로 볼 시간(초)입니다.
+    token_max_age: float = 300.0
+
     def __init__(
-        self, state: HTTPClient, organization: Organization, **response_data: Any
+        self,
+        state: HTTPClient,
+        organization: Organization,
+        token_issued_at: Optional[float] = None,
+        **response_data: Any,
     ) -> None:
         super().__init__(**response_data)
         self.state = state
         self.organization_object = organization
+        self._token_issued_at = token_issued_at
         self._is_logout: bool = False
+        self._refreshing: Optional["asyncio.Future[Any]"] = None
 
     def __repr__(self) -> str:
         return f"<User id={self.id} name={self.name} device_uuid={self.device_uuid} is_logout={self.is_logout}>"
@@ -128,6 +150,33 @@ class User(BaseHCSModel):
         """
         return self.data.get("token")
 
+    @property
+    def token_issued_at(self) -> Optional[float]:
+        """
+        유저 정보(getUserInfo)에서 토큰을 발급받은 시간을 unix timestamp로 반환합니다.
+        그룹 목록 등 다른 곳에서 받은 토큰이면 None을 반환합니다.
+        """
+        return self._token_issued_at
+
+    @property
+    def token_expires_at(self) -> Optional[float]:
+        """
+        유저 토큰(JWT)의 만료 시간을 unix timestamp로 반환합니다.
+        """
+        return token_expires_at(self.token)
+
+    @property
+    def is_token_fresh(self) -> bool:
+        """
+        유저 정보를 다시 가져오지 않고 자가진단에 바로 사용할 수 있는 토큰인지 반환합니다.
+        만료 시간을 알 수 있으면 만료 시간으로, 알 수 없으면 발급받은 뒤 지난 시간(token_max_age)으로 판단합니다.
+        """
+        if self._token_issued_at is None or not self.token:
+            return False
+        if self.token_expires_at is not None:
+            return not is_token_expired(self.token)
+        return time.time() - self._token_issued_at < self.token_max_age
+
     @property
     def is_logout(self) -> Optional[bool]:
         """
@@ -182,6 +231,25 @@ class User(BaseHCSModel):
             endpoint=self.organization.endpoint, token=self.token, password=password
         )
 
+    async def refresh_token(self) -> Optional[str]:
+        """
+        유저 정보를 다시 가져와 유저 토큰을 새 토큰으로 교체하고 반환합니다.
+        동시에 여러번 호출해도 요청은 한번만 보냅니다.
+        """
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(
+                self.state.get_user(
+                    endpoint=self.organization.endpoint,
+                    code=self.organization.id,
+                    user_id=self.id,
+                    token=self.token,
+                )
+            )
+        data: Any = await asyncio.shield(self._refreshing)
+        self._response_data.update(data)
+        self._token_issued_at = time.time()
+        return self.token
+
     @duplicate("survey", "register_survey", "submit_survey")
     async def check(
         self,
@@ -211,23 +279,34 @@ class User(BaseHCSModel):
             3. 학생 본인이 PCR 등 검사를 받고 그 결과를 기다리고 있나요?
         log_name: Optional[str]
             자가진단 로그 이름을 지정합니다. 비워둘 경우 name 파라미터에서 이름을 가져옵니다.
+
+        토큰이 새 토큰이면(is_token_fresh) 유저 정보를 다시 가져오지 않고 바로 제출하며,
+        토큰 인증에 실패하면 유저 정보를 다시 가져와 한번 더 제출합니다.
         """
         if not log_name:
             log_name = self.name
-        data: Any = await self.state.get_user(
-            endpoint=self.organization.endpoint,
-            code=self.organization.id,
-            user_id=self.id,
-            token=self.token,
-        )
-        await self.state.check_survey(
-            endpoint=self.organization.endpoint,
-            token=data.get("token"),
-            option1=option1,
-            option2=option2,
-            option3=option3,
-            log_name=log_name,
-        )
+
+        async def submit() -> None:
+            await self.state.check_survey(
+                endpoint=self.organization.endpoint,
+                token=self.token,
+                option1=option1,
+                option2=option2,
+                option3=option3,
+                log_name=log_name,
+            )
+
+        if not self.is_token_fresh:
+            await self.refresh_token()
+            await submit()
+            return
+        try:
+            await submit()
+        except HTTPException as error:
+            if error.code not in AUTH_ERROR_STATUSES:
+                raise
+            await self.refresh_token()
+            await submit()
 
     async def change_password(self, password: str, new_password: str) -> None:
         """
@@ -275,7 +354,9 @@ class User(BaseHCSModel):
         return response
 
     @duplicate("get_announcement")
-    async def get_notice(self, page: int = 0) -> List[Board]:
+    async def get_notice(
+        self, page: int = 0, concurrency: int = 8, lazy: bool = False
+    ) -> List[Board]:
         """
         자가진단 공지사항을 반환합니다.
 
@@ -283,18 +364,152 @@ class User(BaseHCSModel):
         ----------
         page: int
             페이지를 지정합니다. 기본값은 0입니다.
+        concurrency: int
+            공지사항 내용을 동시에 가져올 최대 요청 수를 입력합니다. 0일 경우 제한하지 않습니다. 기본값은 8 입니다.
+        lazy: bool
+            True일 경우 공지사항 내용을 미리 가져오지 않고, <Board>.get_content 를 처음 호출할 때 가져옵니다.
         """
         response = await self.state.get_notice_list(
             endpoint=self.organization.endpoint, token=self.token, page=page
         )
+        return await self._build_boards(response, concurrency, lazy)
+
+    async def _build_boards(
+        self, response: List[Any], concurrency: int, lazy: bool
+    ) -> List[Board]:
+        if lazy:
+            return [
+                Board(
+                    loader=functools.partial(
+                        self.get_notice_content, board_data["idxNtc"]
+                    ),
+                    **board_data,
+                )
+                for board_data in response
+            ]
+        contents = await gather_limited(
+            (self.get_notice_content(board_data["idxNtc"]) for board_data in response),
+            limit=concurrency,
+        )
         return [
-            Board(
-                body_content=await self.get_notice_content(board_data["idxNtc"]),
-                **board_data,
-            )
-            for board_data in response
+            Board(body_content=content, **board_data)
+            for content, board_data in zip(contents, response)
         ]
 
+    async def iter_notices(
+        self,
+        start_page: int = 0,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+        concurrency: int = 8,
+        lazy: bool = False,
+    ) -> AsyncIterator[Board]:
+        """
+        자가진단 공지사항을 첫 페이지부터 차례대로 반환합니다. 빈 페이지를 만나면 멈춥니다.
+        현재 페이지를 사용하는 동안 다음 페이지를 미리 가져오며, 미리 가져온 페이지는 최대 prefetch개까지만 보관합니다.
+
+        Parameters
+        ----------
+        start_page: int
+            시작할 페이지를 지정합니다. 기본값은 0입니다.
+        prefetch: int
+            미리 가져와 보관할 최대 페이지 수를 입력합니다. 기본값은 1 입니다.
+        max_pages: Optional[int]
+            가져올 최대 페이지 수를 입력합니다. 비워둘 경우 빈 페이지가 나올 때까지 가져옵니다.
+        concurrency: int
+            공지사항 내용을 동시에 가져올 최대 요청 수를 입력합니다. 기본값은 8 입니다.
+        lazy: bool
+            True일 경우 공지사항 내용을 미리 가져오지 않습니다. <User>.get_notice 를 참고하세요.
+        """
+        pages: "asyncio.Queue[Union[List[Board], BaseException, None]]" = asyncio.Queue(
+            maxsize=max(1, prefetch)
+        )
+
+        async def produce() -> None:
+            page = start_page
+            try:
+                while max_pages is None or page - start_page < max_pages:
+                    boards = await self.get_notice(
+                        page, concurrency=concurrency, lazy=lazy
+                    )
+                    if not boards:
+                        break
+                    await pages.put(boards)
+                    page += 1
+            except Exception as error:
+                await pages.put(error)
+                return
+            await pages.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                boards = await pages.get()
+                if boards is None:
+                    break
+                if isinstance(boards, BaseException):
+                    raise boards
+                for board in boards:
+                    yield board
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def sync_notices(
+        self,
+        store: WatermarkStoreABC,
+        initial_pages: int = 1,
+        max_pages: Optional[int] = None,
+        concurrency: int = 8,
+        lazy: bool = False,
+    ) -> List[Board]:
+        """
+        마지막으로 동기화한 뒤 새로 올라온 공지사항만 최신순으로 반환합니다.
+        호스트(Organization.endpoint)별로 확인한 위치를 store에 저장하며, 이미 확인한 글이 나오면 더 이상 페이지를 가져오지 않습니다.
+
+        Parameters
+        ----------
+        store: WatermarkStoreABC
+            확인한 위치를 저장할 저장소(MemoryWatermarkStore, SQLiteWatermarkStore 등)를 입력합니다.
+        initial_pages: int
+            처음 동기화할 때 가져올 페이지 수를 입력합니다. 기본값은 1 입니다.
+        max_pages: Optional[int]
+            한번에 가져올 최대 페이지 수를 입력합니다. 비워둘 경우 확인한 글이 나올 때까지 가져옵니다.
+        concurrency: int
+            공지사항 내용을 동시에 가져올 최대 요청 수를 입력합니다. 기본값은 8 입니다.
+        lazy: bool
+            True일 경우 공지사항 내용을 미리 가져오지 않습니다. <User>.get_notice 를 참고하세요.
+        """
+        key = self.organization.endpoint or ""
+        watermark = await store.get(key)
+        if watermark is None:
+            max_pages = initial_pages
+        new_items: List[Any] = []
+        page = 0
+        while max_pages is None or page < max_pages:
+            response = await self.state.get_notice_list(
+                endpoint=self.organization.endpoint, token=self.token, page=page
+            )
+            if not response:
+                break
+            fresh = [
+                board_data
+                for board_data in response
+                if watermark is None or watermark.is_new(board_data)
+            ]
+            new_items.extend(fresh)
+            if len(fresh) < len(response):
+                break
+            page += 1
+        if not new_items:
+            return []
+        boards = await self._build_boards(new_items, concurrency, lazy)
+        latest = watermark or NoticeWatermark(last_id=int(new_items[0]["idxNtc"]))
+        for board_data in new_items:
+            latest = latest.advance(board_data)
+        await store.set(key, latest)
+        return boards
+
     async def search_hospital(
         self, location: Optional[str] = None, name: Optional[str] = None
     ) -> List[Hospital]:
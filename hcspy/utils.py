@@ -1,5 +1,18 @@
 from base64 import b64decode, b64encode
-from typing import Dict, List, Optional, Any
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Any,
+    Sequence,
+    Tuple,
+)
+import asyncio
+import threading
+import time
 import types
 import functools
 import jwt
@@ -10,18 +23,30 @@ from Crypto.Cipher.PKCS1_v1_5 import PKCS115_Cipher
 from Crypto.PublicKey import RSA
 from Crypto.PublicKey.RSA import RsaKey
 
+_LOGIN_PUBLIC_KEY: str = (
+    "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA81dCnCKt0NVH7j5Oh2"
+    "+SGgEU0aqi5u6sYXemouJWXOlZO3jqDsHYM1qfEjVvCOmeoMNFXYSXdNhflU7mjWP8jWUmkYIQ8o3FGqMzsMTNxr"
+    "+bAp0cULWu9eYmycjJwWIxxB7vUwvpEUNicgW7v5nCwmF5HS33Hmn7yDzcfjfBs99K5xJEppHG0qc"
+    "+q3YXxxPpwZNIRFn0Wtxt0Muh1U8avvWyw03uQ/wMBnzhwUC8T4G5NclLEWzOQExbQ4oDlZBv8BM"
+    "/WxxuOyu0I8bDUDdutJOfREYRZBlazFHvRKNNQQD2qDfjRz484uFs7b5nykjaMB9k/EJAuHjJzGs9MMMWtQIDAQAB== "
+)
+_login_cipher: Optional[PKCS115_Cipher] = None
+_login_cipher_lock = threading.Lock()
+
+
+def _get_login_cipher() -> PKCS115_Cipher:
+    global _login_cipher
+    if _login_cipher is None:
+        with _login_cipher_lock:
+            if _login_cipher is None:
+                rsa_public_key: bytes = b64decode(_LOGIN_PUBLIC_KEY)
+                pub_key: RsaKey = RSA.importKey(rsa_public_key)
+                _login_cipher = PKCS1_v1_5.new(pub_key)
+    return _login_cipher
+
 
 def encrypt_login(content: str) -> str:
-    pubkey: str = (
-        "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA81dCnCKt0NVH7j5Oh2"
-        "+SGgEU0aqi5u6sYXemouJWXOlZO3jqDsHYM1qfEjVvCOmeoMNFXYSXdNhflU7mjWP8jWUmkYIQ8o3FGqMzsMTNxr"
-        "+bAp0cULWu9eYmycjJwWIxxB7vUwvpEUNicgW7v5nCwmF5HS33Hmn7yDzcfjfBs99K5xJEppHG0qc"
-        "+q3YXxxPpwZNIRFn0Wtxt0Muh1U8avvWyw03uQ/wMBnzhwUC8T4G5NclLEWzOQExbQ4oDlZBv8BM"
-        "/WxxuOyu0I8bDUDdutJOfREYRZBlazFHvRKNNQQD2qDfjRz484uFs7b5nykjaMB9k/EJAuHjJzGs9MMMWtQIDAQAB== "
-    )
-    rsa_public_key: bytes = b64decode(pubkey)
-    pub_key: RsaKey = RSA.importKey(rsa_public_key)
-    cipher: PKCS115_Cipher = PKCS1_v1_5.new(pub_key)
+    cipher: PKCS115_Cipher = _get_login_cipher()
     msg: bytes = content.encode("utf-8")
     length = 245
     msg_list: List[bytes] = [
@@ -33,13 +58,90 @@ def encrypt_login(content: str) -> str:
     return encrypt_msg_list[0].decode("utf-8")
 
 
+def encrypt_many(contents: Sequence[str]) -> List[str]:
+    """여러 로그인 필드를 한번에 암호화합니다.
+
+    Parameters
+    ----------
+    contents: Sequence[str]
+        암호화할 문자열들을 입력합니다.
+    """
+    return [encrypt_login(content) for content in contents]
+
+
+def token_expires_at(token: Optional[str]) -> Optional[float]:
+    """자가진단 토큰(JWT)의 만료 시간을 unix timestamp로 반환합니다.
+
+    토큰을 해석할 수 없거나 만료 시간이 없는 경우 None을 반환합니다.
+
+    Parameters
+    ----------
+    token: Optional[str]
+        "Bearer " 로 시작하거나 시작하지 않는 토큰을 입력합니다.
+    """
+    if not token:
+        return None
+    if token.startswith("Bearer "):
+        token = token[len("Bearer ") :]
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return None
+    expires_at = claims.get("exp")
+    if not isinstance(expires_at, (int, float)):
+        return None
+    return float(expires_at)
+
+
+def is_token_expired(token: Optional[str], margin: float = 30.0) -> bool:
+    """토큰이 만료되었거나 margin초 안에 만료되는지 반환합니다.
+
+    만료 시간을 알 수 없는 토큰은 만료되지 않은 것으로 간주합니다.
+
+    Parameters
+    ----------
+    token: Optional[str]
+        확인할 토큰을 입력합니다.
+    margin: float
+        만료 시간보다 얼마나 일찍 만료된 것으로 볼지(초) 입력합니다. 기본값은 30 입니다.
+    """
+    if not token:
+        return True
+    expires_at = token_expires_at(token)
+    if expires_at is None:
+        return False
+    return time.time() + margin >= expires_at
+
+
+_ALIAS_MAPS: Dict[Tuple[int, str], Tuple[Dict[str, List[str]], Dict[str, str]]] = {}
+
+
+def reverse_aliases(data: Dict[str, List[str]], prefix: str) -> Dict[str, str]:
+    """
+    {코드: [별칭, ...]} 형태의 데이터를 {별칭: 코드} 형태로 뒤집어 반환합니다.
+    코드에서 prefix는 제거되며, 결과는 데이터마다 한번만 만들어 재사용합니다.
+    """
+    cached = _ALIAS_MAPS.get((id(data), prefix))
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    aliases: Dict[str, str] = {}
+    for key, values in data.items():
+        for value in values:
+            aliases.setdefault(value, key.replace(prefix, ""))
+    _ALIAS_MAPS[(id(data), prefix)] = (data, aliases)
+    return aliases
+
+
 def multi_finder(
     data: Dict[str, List[str]], keyword: Optional[str], prefix: str
 ) -> Optional[str]:
-    for key, value in data.items():
-        if keyword in value:
-            return key.replace(prefix, "")
-    return None
+    if keyword is None:
+        return None
+    aliases = reverse_aliases(data, prefix)
+    code = aliases.get(keyword)
+    if code is None:
+        code = aliases.get("".join(keyword.split()))
+    return code
 
 
 def url_create_with(url: str, **query: Any) -> str:
@@ -50,6 +152,83 @@ def url_create_with(url: str, **query: Any) -> str:
     return _url[:-1]
 
 
+async def run_stages(
+    stages: Dict[str, Tuple[Sequence[str], Callable[[Dict[str, Any]], Awaitable[Any]]]],
+    timings: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> Dict[str, Any]:
+    """의존 관계가 있는 비동기 작업들을 가능한 한 동시에 실행합니다.
+
+    각 작업은 의존하는 작업이 모두 끝나면 바로 시작되며, 끝난 작업들의 결과를 인자로 받습니다.
+    하나라도 실패하면 나머지 작업을 취소하고 예외를 발생시킵니다.
+
+    Parameters
+    ----------
+    stages: Dict[str, Tuple[Sequence[str], Callable]]
+        작업 이름과 (의존하는 작업 이름들, 작업 함수) 쌍을 입력합니다.
+    timings: Optional[Dict[str, Tuple[float, float]]]
+        입력한 경우 작업별 (시작 시간, 소요 시간)을 초 단위로 기록합니다.
+    """
+    loop = asyncio.get_running_loop()
+    origin = loop.time()
+    results: Dict[str, Any] = {}
+    tasks: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def run(
+        name: str,
+        depends: Sequence[str],
+        stage: Callable[[Dict[str, Any]], Awaitable[Any]],
+    ) -> Any:
+        if depends:
+            await asyncio.gather(*(tasks[depend] for depend in depends))
+        started_at = loop.time()
+        result = results[name] = await stage(results)
+        if timings is not None:
+            timings[name] = (started_at - origin, loop.time() - started_at)
+        return result
+
+    for name, (depends, _) in stages.items():
+        missing = [depend for depend in depends if depend not in stages]
+        if missing:
+            raise ValueError(f"{name} 작업이 없는 작업 {missing}에 의존합니다.")
+    for name, (depends, stage) in stages.items():
+        tasks[name] = asyncio.ensure_future(run(name, depends, stage))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[Any]], limit: int = 0, return_exceptions: bool = False
+) -> List[Any]:
+    """여러 작업을 최대 limit개씩 동시에 실행하고 입력한 순서대로 결과를 반환합니다.
+
+    Parameters
+    ----------
+    aws: Iterable[Awaitable[Any]]
+        실행할 작업들을 입력합니다.
+    limit: int
+        동시에 실행할 최대 작업 수를 입력합니다. 0일 경우 제한하지 않습니다.
+    return_exceptions: bool
+        True일 경우 실패한 작업의 예외를 결과에 담아 반환합니다.
+    """
+    if limit <= 0:
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
 def copy_function(function):
     g = types.FunctionType(
         function.__code__,
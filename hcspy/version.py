@@ -0,0 +1,134 @@
+import asyncio
+import re
+import time
+from typing import Awaitable, Callable, Optional
+
+_HEAD_PATTERN = re.compile(r"<head\b[^>]*>(.*?)</head>", re.IGNORECASE | re.DOTALL)
+_LINK_HREF_PATTERN = re.compile(
+    r"<link\b[^>]*?\bhref\s*=\s*[\"']?([^\"'\s>]+)", re.IGNORECASE | re.DOTALL
+)
+
+
+def extract_client_version(html: str) -> Optional[str]:
+    """자가진단 사이트 html에서 클라이언트 버전을 추출합니다.
+
+    BeautifulSoup으로 전체 문서를 파싱하지 않고 ``<head>`` 의 첫번째 ``<link>`` 태그만 찾습니다.
+
+    Parameters
+    ----------
+    html: str
+        자가진단 사이트의 html 문서를 입력합니다.
+    """
+    head = _HEAD_PATTERN.search(html)
+    match = _LINK_HREF_PATTERN.search(head.group(1) if head else html)
+    if not match:
+        return None
+    parts = match.group(1).strip("/").split("/")
+    if len(parts) < 2:
+        return None
+    return str(parts[-2])
+
+
+class ClientVersionResolver:
+    """자가진단 클라이언트 버전을 캐시하고 갱신하는 resolver 입니다."""
+
+    __slots__ = ("_fetcher", "_ttl", "_version", "_expires_at", "_lock", "_task")
+
+    def __init__(
+        self, fetcher: Callable[[], Awaitable[str]], ttl: float = 3600.0
+    ) -> None:
+        """
+        Parameters
+        ----------
+        fetcher: Callable[[], Awaitable[str]]
+            서버에서 클라이언트 버전을 가져오는 코루틴 함수를 입력합니다.
+        ttl: float
+            가져온 버전을 캐시할 시간(초)을 입력합니다. 기본값은 3600 입니다.
+        """
+        self._fetcher = fetcher
+        self._ttl = ttl
+        self._version: Optional[str] = None
+        self._expires_at: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def version(self) -> Optional[str]:
+        """캐시된 클라이언트 버전을 반환합니다. 만료 여부는 확인하지 않습니다."""
+        return self._version
+
+    @property
+    def is_expired(self) -> bool:
+        """캐시된 버전이 없거나 만료되었는지 반환합니다."""
+        return self._version is None or time.monotonic() >= self._expires_at
+
+    def invalidate(self) -> None:
+        """캐시된 버전을 만료시킵니다. 다음 요청에서 버전을 새로 가져옵니다."""
+        self._expires_at = 0.0
+
+    async def get(self) -> str:
+        """캐시된 클라이언트 버전을 반환합니다. 만료된 경우 한번만 새로 가져옵니다."""
+        if not self.is_expired:
+            return self._version  # type: ignore[return-value]
+        return await self.refresh(force=False)
+
+    async def refresh(self, force: bool = True) -> str:
+        """클라이언트 버전을 서버에서 새로 가져옵니다.
+
+        동시에 여러 요청이 들어와도 서버 요청은 한번만 실행됩니다.
+
+        Parameters
+        ----------
+        force: bool
+            캐시가 만료되지 않았더라도 새로 가져옵니다. 기본값은 True 입니다.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        started_at = time.monotonic()
+        async with self._lock:
+            # 대기하는 동안 다른 요청이 이미 갱신한 경우 그 결과를 사용합니다.
+            refreshed = self._expires_at - self._ttl >= started_at
+            if self._version is not None and (
+                refreshed or (not force and not self.is_expired)
+            ):
+                return self._version
+            version = await self._fetcher()
+            self._version = version
+            self._expires_at = time.monotonic() + self._ttl
+            return version
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """백그라운드에서 클라이언트 버전을 주기적으로 갱신합니다.
+
+        Parameters
+        ----------
+        interval: Optional[float]
+            갱신 주기(초)를 입력합니다. 비워둘 경우 ttl의 80%를 사용합니다.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.ensure_future(
+            self._refresh_loop(interval if interval else self._ttl * 0.8)
+        )
+
+    async def stop(self) -> None:
+        """백그라운드 갱신을 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 갱신에 실패하면 기존 버전을 유지하고 다음 주기에 다시 시도합니다.
+                pass
+            await asyncio.sleep(interval)
@@ -41,6 +41,7 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=requirements,
+    extras_require={"native": ["cryptography"]},
     keywords=["korea", "covid", "auto", "hcspy", "corona", "covid19"],
     python_requires=">=3.8",
     classifiers=[
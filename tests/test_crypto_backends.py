@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from hcspy import crypto
+
+pytest.importorskip("cryptography")
+
+if crypto.CryptographySeedBackend.name not in crypto.SEED_BACKENDS:
+    pytest.skip("설치된 OpenSSL 이 SEED 를 지원하지 않습니다.", allow_module_level=True)
+
+
+@pytest.mark.parametrize("blocks", [1, 2, 5, 32, 256])
+def test_backends_match(blocks):
+    for _ in range(20):
+        key, iv, data = os.urandom(16), os.urandom(16), os.urandom(16 * blocks)
+        expected = crypto.PythonSeedBackend(key).cbc_encrypt(iv, data)
+        assert crypto.CryptographySeedBackend(key).cbc_encrypt(iv, data) == expected
+
+
+def test_backends_match_with_session_key():
+    # 실제 암호화처럼 Crypto의 세션 키와 0으로 채운 짧은 메시지를 사용합니다.
+    python_crypto = crypto.Crypto(seed_backend="python")
+    native_crypto = crypto.Crypto(seed_backend="cryptography")
+    native_crypto.sessionKey = python_crypto.sessionKey
+    iv = bytes(16)
+    messages = [b"1234", b"0000", os.urandom(16), os.urandom(48)]
+    assert native_crypto.seed_encrypt_many(iv, messages) == (
+        python_crypto.seed_encrypt_many(iv, messages)
+    )
+
+
+def test_default_backend_is_native():
+    assert crypto.get_seed_backend() is crypto.CryptographySeedBackend
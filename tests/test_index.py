@@ -0,0 +1,69 @@
+from hcspy.data import school_areas, school_levels
+from hcspy.index import OrganizationIndex, _default_queries
+
+SEOUL_HIGH = ("school", "고등학교", "4", "01")
+SEOUL_KINDERGARTEN = ("school", "유치원", "1", "01")
+
+
+def make_index():
+    index = OrganizationIndex()
+    index.add(
+        SEOUL_HIGH,
+        [
+            {"orgCode": "B100000001", "kraOrgNm": "서울고등학교"},
+            {"orgCode": "B100000002", "kraOrgNm": "서울과학고등학교"},
+        ],
+    )
+    index.add(SEOUL_KINDERGARTEN, [{"orgCode": "B100000003", "kraOrgNm": "서울유치원"}])
+    return index
+
+
+def test_default_queries_cover_every_level_and_area():
+    queries = [query for query in _default_queries() if query[0] == "school"]
+    assert len(queries) == len(school_areas) * len(school_levels)
+    assert ("school", "유치원", "1", "01") in queries
+    for _, name, level, _ in queries:
+        assert name == school_levels[f"level{level}"][0]
+
+
+def test_search_exact_alias_and_prefix():
+    index = make_index()
+    assert [org.id for org in index.search("서울고등학교")][0] == "B100000001"
+    assert [org.id for org in index.search("서울고")][0] == "B100000001"
+    assert {org.id for org in index.search("서울", limit=10)} == {
+        "B100000001",
+        "B100000002",
+        "B100000003",
+    }
+    assert [org.id for org in index.search("서우")]
+
+
+def test_search_filters_and_fuzzy():
+    index = make_index()
+    assert [org.id for org in index.search("서울", level="유")] == ["B100000003"]
+    assert [org.id for org in index.search("서울", level="고", area="부산")] == []
+    assert [org.id for org in index.search("서울과학고등핵교")][0] == "B100000002"
+    assert index.search("서울과학고등핵교", fuzzy=False) == []
+
+
+def test_add_removes_missing_organizations():
+    index = make_index()
+    assert index.add(
+        SEOUL_HIGH, [{"orgCode": "B100000001", "kraOrgNm": "서울고등학교"}]
+    )
+    assert "B100000002" not in index
+    assert not index.add(
+        SEOUL_HIGH, [{"orgCode": "B100000001", "kraOrgNm": "서울고등학교"}]
+    )
+    assert len(index) == 2
+
+
+def test_save_and_load(tmp_path):
+    index = make_index()
+    path = str(tmp_path / "index.json")
+    index.save(path)
+    loaded = OrganizationIndex.load(path)
+    assert len(loaded) == len(index)
+    organization = loaded.get("B100000003")
+    assert organization is not None and organization.name == "서울유치원"
+    assert [org.id for org in loaded.search("서울고")][0] == "B100000001"